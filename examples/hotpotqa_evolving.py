@@ -161,6 +161,10 @@ async def main(args: argparse.Namespace) -> None:
     from src.workflow.environment import Environment
     from src.orchestrator.config import SEMAConfig
     from src.orchestrator.orchestrator import SEMAOrchestrator
+    from src.models.base import AsyncBaseLLM
+    from src.utils import ensure_default_logging
+
+    ensure_default_logging()
 
     # ------------------------------------------------------------------
     # 1. Define the task environment
@@ -211,12 +215,16 @@ async def main(args: argparse.Namespace) -> None:
     # ------------------------------------------------------------------
     orch = SEMAOrchestrator(config)
 
-    if args.resume:
-        print(f'Resuming from checkpoint (gen={args.checkpoint_gen})...\n')
-        result: dict[str, Any] = await orch.resume(args.checkpoint_gen)
-    else:
-        print('Starting fresh evolution run...\n')
-        result = await orch.run()
+    try:
+        if args.resume:
+            print(f'Resuming from checkpoint (gen={args.checkpoint_gen})...\n')
+            result: dict[str, Any] = await orch.resume(args.checkpoint_gen)
+        else:
+            print('Starting fresh evolution run...\n')
+            result = await orch.run()
+    finally:
+        # Release the connection pool shared by all provider SDK clients
+        await AsyncBaseLLM.aclose_shared_http_client()
 
     # ------------------------------------------------------------------
     # 4. Print generation-by-generation summary table
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List
 
 from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
@@ -11,11 +12,15 @@ from ..models.models import AsyncLLM, AsyncBaseLLM
 
 
 class AgentConfig(BaseModel):
-    '''Configuration for an agent.'''
+    '''Configuration for an agent.
+
+    Frozen: validated once at construction and never mutated afterwards.
+    Derive a variant with `config.model_copy(update={...})`.
+    '''
 
     model_config = ConfigDict(
         extra='allow',
-        validate_assignment=True,
+        frozen=True,
     )
 
     model: str = Field(default='gpt-4o-mini', description='LLM model name to use')
@@ -24,25 +29,25 @@ class AgentConfig(BaseModel):
     temperature: float | None = Field(default=None, ge=0.0, le=2.0, description='LLM temperature')
 
 
-class AgentState(BaseModel):
-    '''State of an agent during execution.'''
-
-    model_config = ConfigDict(
-        extra='allow',
-        validate_assignment=True,
-    )
+@dataclass(slots=True)
+class AgentState:
+    '''State of an agent during execution.
 
-    metadata: Dict[str, Any] = Field(default_factory=dict, description='Arbitrary metadata')
-    question: str = Field(default='', description='The question being answered')
-    context: str = Field(default='', description='Context information for the question')
-    steps: List[Dict[str, Any]] = Field(default_factory=list, description='History of reasoning steps')
-    memory_retrievals: List[Dict[str, Any]] = Field(default_factory=list, description='Memory retrieval results')
-    tool_calls: List[Dict[str, Any]] = Field(default_factory=list, description='Tool call history')
-    reasoning_trace: List[str] = Field(default_factory=list, description='Reasoning trace for analysis')
-    reward: float = Field(default=0.0, description='Reward signal from environment')
-    answer: str = Field(default='', description='The current answer')
-    finished: bool = Field(default=False, description='Whether the agent has finished')    
+    A slotted dataclass rather than a Pydantic model: it is mutated on every
+    reasoning step, so attribute writes skip validation. Arbitrary extra data
+    belongs in `metadata`.
+    '''
 
+    metadata: Dict[str, Any] = field(default_factory=dict)              # Arbitrary metadata
+    question: str = ''                                                  # The question being answered
+    context: str = ''                                                   # Context information for the question
+    steps: List[Dict[str, Any]] = field(default_factory=list)           # History of reasoning steps
+    memory_retrievals: List[Dict[str, Any]] = field(default_factory=list)  # Memory retrieval results
+    tool_calls: List[Dict[str, Any]] = field(default_factory=list)      # Tool call history
+    reasoning_trace: List[str] = field(default_factory=list)            # Reasoning trace for analysis
+    reward: float = 0.0                                                 # Reward signal from environment
+    answer: str = ''                                                    # The current answer
+    finished: bool = False                                              # Whether the agent has finished
 
 
 class Agent(BaseModel, ABC):
@@ -53,6 +58,10 @@ class Agent(BaseModel, ABC):
         validate_assignment=True,
     )
 
+    # One LLM client per model, shared by every agent that uses it, so
+    # concurrent agents reuse a single connection pool.
+    _llm_registry: ClassVar[Dict[tuple[str], AsyncBaseLLM]] = {}
+
     config: AgentConfig = Field(default_factory=AgentConfig)
     _llm: AsyncBaseLLM | None = PrivateAttr(default=None)
     _memory: Any = PrivateAttr(default=None)
@@ -61,9 +70,13 @@ class Agent(BaseModel, ABC):
 
     @property
     def llm(self) -> AsyncBaseLLM:
-        '''Lazy initialization of LLM.'''
+        '''Lazy initialization of LLM, shared across agents with the same model.'''
         if self._llm is None:
-            self._llm = AsyncLLM(self.config.model)
+            key = (self.config.model,)
+            llm = Agent._llm_registry.get(key)
+            if llm is None:
+                llm = Agent._llm_registry.setdefault(key, AsyncLLM(self.config.model))
+            self._llm = llm
         return self._llm
 
     @property
@@ -89,12 +102,20 @@ class Agent(BaseModel, ABC):
 
     @abstractmethod
     async def step(self, state: AgentState) -> AgentState:
-        '''Execute one step of the agent's reasoning.'''
+        '''Execute one step of the agent's reasoning.
+
+        Build `AgentState(...)` once at entry (in `run`). Step-to-step
+        transitions are trusted internal edges: mutate `state` in place, or
+        derive a copy with `dataclasses.replace(state, answer=..., finished=True)`,
+        rather than rebuilding the state from scratch.
+        '''
         ...
 
     def reset(self) -> None:
-        '''Reset the agent's state for a new question.'''
-        self._llm = None
+        '''Reset the agent's state for a new question.
+
+        The LLM client is kept: it is shared via the registry and stateless per question.
+        '''
         self._state = None
 
     def build_prompt(self, state: AgentState) -> str:
@@ -55,7 +55,8 @@ class Benchmark(ABC):
         callback: Any,
         dataset: str = 'validate',
         num_samples: int | None = None,
-        verbose: bool = False
+        verbose: bool = False,
+        concurrency: int = 16
     ) -> dict:
         '''
         Abstract method to run the benchmark evaluation using the provided callback function.
@@ -65,6 +66,7 @@ class Benchmark(ABC):
             dataset: The dataset to use ('train', 'validate', 'test').
             num_samples: Number of samples to evaluate (None for all).
             verbose: Whether to print detailed logs.
+            concurrency: Maximum number of samples evaluated concurrently.
         
         Returns:
             Dictionary with aggregated metrics and individual results
@@ -110,13 +112,13 @@ class DatasetType(Enum):
     ALL = 'all'
     
     @classmethod
-    def from_value(cls, value: str, default: 'DatasetType' = VALIDATE) -> 'DatasetType':
+    def from_value(cls, value: str, default: DatasetType | None = None) -> DatasetType | None:
         '''
         Get enum object by value (case-insensitive).
         
         Args:
             value: Enum value string
-            default: Default value to return if not found
+            default: Default value to return if not found (None unless given)
             
         Returns:
             Corresponding enum object, or default if not found
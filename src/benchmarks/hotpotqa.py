@@ -1,9 +1,12 @@
 import os
+import math
+import pickle
+import asyncio
 from pathlib import Path
 from typing import Any, List, Dict, Callable, Awaitable
 
 from .benchmark import Benchmark, DatasetType
-from .measures import exact_match_score, f1_score
+from .measures import batch_scores, exact_match_score, f1_score
 from ..config.paths import SEMAPaths
 from ..utils.file_utils import load_json, download_file
 from ..utils import get_logger
@@ -63,6 +66,8 @@ class HotpotQA(Benchmark):
         '''
         Load a specific dataset (train/validate/test) based on the provided dataset info.
         If the dataset file does not exist or force_reload is True, it downloads the dataset.
+        Parsed data is cached in a `<file>.pkl` sidecar that is reused while it is
+        newer than the JSON file.
         '''
 
         if dataset is None:
@@ -72,7 +77,29 @@ class HotpotQA(Benchmark):
         if not os.path.exists(file_path) or force_reload:
             download_file(url=dataset['url'], destination_path=file_path)
         
+        # Prefer the pickled sidecar when it is at least as new as the raw JSON
+        cache_path = file_path + '.pkl'
+        if (
+            not force_reload
+            and os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(file_path)
+        ):
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+            except Exception as e:
+                logger.warning(f'Ignoring unreadable dataset cache {cache_path}: {e}')
+        
         data = load_json(file_path)
+        
+        try:
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f'Failed to write dataset cache {cache_path}: {e}')
+        
         return data
         
     async def evaluate(self, prediction: Any, label: Any) -> dict:
@@ -106,7 +133,8 @@ class HotpotQA(Benchmark):
         callback: Callable[[str, Any], Awaitable[str]],
         dataset: str = 'validate',
         num_samples: int | None = None,
-        verbose: bool = False
+        verbose: bool = False,
+        concurrency: int = 16
     ) -> Dict[str, Any]:
         '''
         Run the benchmark on a dataset using the provided agent function.
@@ -116,19 +144,22 @@ class HotpotQA(Benchmark):
             dataset: Which dataset to use ('train', 'validate', 'test')
             num_samples: Number of samples to evaluate (None for all)
             verbose: Whether to print progress
+            concurrency: Maximum number of samples evaluated concurrently
             
         Returns:
             Dictionary with aggregated metrics and individual results
         '''
-        # Get the appropriate dataset
-        if dataset == 'train':
-            data = self.train_data
-        elif dataset == 'validate':
-            data = self.validate_data
-        elif dataset == 'test':
-            data = self.test_data
-        else:
+        # Get the appropriate dataset; read the backing fields directly to
+        # skip the logging checks in the public properties
+        dataset_map = {
+            DatasetType.TRAIN: self._train_data,
+            DatasetType.VALIDATE: self._validate_data,
+            DatasetType.TEST: self._test_data,
+        }
+        dataset_type = DatasetType.from_value(dataset)
+        if dataset_type not in dataset_map:
             raise ValueError(f'Unknown dataset: {dataset}')
+        data = dataset_map[dataset_type]
         
         if data is None:
             raise ValueError(f'Dataset "{dataset}" not loaded')
@@ -137,67 +168,85 @@ class HotpotQA(Benchmark):
         if num_samples is not None:
             data = data[:num_samples]
         
-        results = []
-        total_em = 0.0
-        total_f1 = 0.0
+        # Split the samples into per-field columns once so dispatch and scoring
+        # iterate plain lists instead of repeating dict lookups per sample
+        n = len(data)
+        ids = [item.get('_id', i) for i, item in enumerate(data)]
+        questions = [item['question'] for item in data]
+        contexts = [item.get('context', []) for item in data]
+        ground_truths = [item['answer'] for item in data]
         
-        for i, item in enumerate(data):
-            question = item['question']
-            context = item.get('context', [])
-            ground_truth = item['answer']
-            
-            if verbose:
-                logger.info(f'Processing {i+1}/{len(data)}: {question[:50]}...')
-            
-            try:
-                # Get prediction from agent
-                prediction = await callback(question, context)
-                
-                # Evaluate
-                eval_result = await self.evaluate(prediction, ground_truth)
+        predictions: List[Any] = [None] * n
+        errors: List[str | None] = [None] * n
+        sem = asyncio.Semaphore(max(1, concurrency))
+        
+        async def _predict(i: int, question: str, context: Any) -> None:
+            async with sem:
+                if verbose:
+                    logger.info(f'Processing {i+1}/{n}: {question[:50]}...')
                 
+                try:
+                    # Get prediction from agent; preallocated slots keep dataset order
+                    predictions[i] = await callback(question, context)
+                except Exception as e:
+                    logger.error(f'Error processing question {i}: {e}')
+                    errors[i] = str(e)
+        
+        tasks = [_predict(i, q, c) for i, (q, c) in enumerate(zip(questions, contexts))]
+        await asyncio.gather(*tasks, return_exceptions=False)
+        
+        # Score all predictions in one batched pass once the LLM calls are done
+        scores = batch_scores(
+            [str(p) if p is not None else '' for p in predictions],
+            [str(g) if g is not None else '' for g in ground_truths],
+        )
+        
+        results: List[Dict[str, Any]] = []
+        ems: List[float] = []
+        f1s: List[float] = []
+        num_passed = 0
+        for i in range(n):
+            if errors[i] is None:
+                em, f1 = scores[i]
                 result = {
-                    'id': item.get('_id', i),
-                    'question': question,
-                    'prediction': prediction,
-                    'ground_truth': ground_truth,
-                    'em': eval_result['em'],
-                    'f1': eval_result['f1'],
-                    'result': eval_result['result']
+                    'id': ids[i],
+                    'question': questions[i],
+                    'prediction': predictions[i],
+                    'ground_truth': ground_truths[i],
+                    'em': em,
+                    'f1': f1,
+                    'result': Benchmark.PASS if em == 1.0 else Benchmark.FAIL
                 }
-                
-                total_em += eval_result['em']
-                total_f1 += eval_result['f1']
-                
-            except Exception as e:
-                logger.error(f'Error processing question {i}: {e}')
+            else:
                 result = {
-                    'id': item.get('_id', i),
-                    'question': question,
+                    'id': ids[i],
+                    'question': questions[i],
                     'prediction': '',
-                    'ground_truth': ground_truth,
+                    'ground_truth': ground_truths[i],
                     'em': 0.0,
                     'f1': 0.0,
                     'result': Benchmark.FAIL,
-                    'error': str(e)
+                    'error': errors[i]
                 }
-            
             results.append(result)
+            ems.append(result['em'])
+            f1s.append(result['f1'])
+            num_passed += result['result'] == Benchmark.PASS
             
             if verbose:
-                logger.info(f'  EM: {result["em"]:.2f}, F1: {result["f1"]:.2f}')
+                logger.info(f'  {i+1}/{n} EM: {result["em"]:.2f}, F1: {result["f1"]:.2f}')
         
-        # Calculate aggregate metrics
-        n = len(results)
-        avg_em = total_em / n if n > 0 else 0.0
-        avg_f1 = total_f1 / n if n > 0 else 0.0
+        # Calculate aggregate metrics; fsum keeps the means exact regardless
+        # of sample count
+        avg_em = math.fsum(ems) / n if n > 0 else 0.0
+        avg_f1 = math.fsum(f1s) / n if n > 0 else 0.0
         
         return {
             'metrics': {
                 'exact_match': avg_em,
                 'f1': avg_f1,
                 'num_samples': n,
-                'num_passed': sum(1 for r in results if r['result'] == Benchmark.PASS)
+                'num_passed': num_passed
             },
             'results': results
         }
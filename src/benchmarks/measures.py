@@ -3,8 +3,14 @@
 import re
 import string
 from collections import Counter
+from functools import lru_cache
 
 
+_ARTICLES_RE = re.compile(r'\b(a|an|the)\b')
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+
+@lru_cache(maxsize=131072)
 def normalize_answer(s: str) -> str:
     '''
     Normalize answer for evaluation.
@@ -16,20 +22,7 @@ def normalize_answer(s: str) -> str:
     Returns:
         Normalized string
     '''
-    def remove_articles(text):
-        return re.sub(r'\b(a|an|the)\b', ' ', text)
-    
-    def white_space_fix(text):
-        return ' '.join(text.split())
-    
-    def remove_punc(text):
-        exclude = set(string.punctuation)
-        return ''.join(ch for ch in text if ch not in exclude)
-    
-    def lower(text):
-        return text.lower()
-    
-    return white_space_fix(remove_articles(remove_punc(lower(s))))
+    return ' '.join(_ARTICLES_RE.sub(' ', s.lower().translate(_PUNCT_TABLE)).split())
 
 
 def f1_score(prediction: str, ground_truth: str) -> float:
@@ -43,11 +36,28 @@ def f1_score(prediction: str, ground_truth: str) -> float:
     Returns:
         F1 score as a float between 0.0 and 1.0
     '''
-    prediction_tokens = normalize_answer(prediction).split()
-    ground_truth_tokens = normalize_answer(ground_truth).split()
+    prediction_tokens = tuple(normalize_answer(prediction).split())
+    ground_truth_tokens = tuple(normalize_answer(ground_truth).split())
+    return _f1_from_tokens(prediction_tokens, ground_truth_tokens)
+
+
+@lru_cache(maxsize=131072)
+def _f1_from_tokens(prediction_tokens: tuple[str, ...], ground_truth_tokens: tuple[str, ...]) -> float:
+    '''Token-level F1 on already-normalized token tuples (cached).'''
+    # Count the longer side once, then walk the shorter side's multiset,
+    # instead of building two Counters plus their `&` intersection.
+    if len(prediction_tokens) <= len(ground_truth_tokens):
+        small, big = prediction_tokens, ground_truth_tokens
+    else:
+        small, big = ground_truth_tokens, prediction_tokens
+    
+    big_counts: dict[str, int] = {}
+    for tok in big:
+        big_counts[tok] = big_counts.get(tok, 0) + 1
     
-    common = Counter(prediction_tokens) & Counter(ground_truth_tokens)
-    num_same = sum(common.values())
+    num_same = 0
+    for tok, count in Counter(small).items():
+        num_same += min(count, big_counts.get(tok, 0))
     
     if num_same == 0:
         return 0.0
@@ -73,3 +83,27 @@ def exact_match_score(prediction: str, ground_truth: str) -> float:
         1.0 if normalized strings match exactly, 0.0 otherwise
     '''
     return float(normalize_answer(prediction) == normalize_answer(ground_truth))
+
+
+def batch_scores(predictions: list[str], ground_truths: list[str]) -> list[tuple[float, float]]:
+    '''
+    Calculate (exact match, F1) for aligned lists of predictions and ground truths.
+    
+    Normalizes every string in one tight pass before scoring, which is cheaper
+    than interleaving normalization with per-sample evaluation.
+    
+    Args:
+        predictions: Predicted answer strings
+        ground_truths: Ground truth answer strings, aligned with predictions
+        
+    Returns:
+        List of (em, f1) tuples in input order
+    '''
+    _normalize = normalize_answer
+    _f1 = _f1_from_tokens
+    preds_norm = [_normalize(p) for p in predictions]
+    gts_norm = [_normalize(g) for g in ground_truths]
+    return [
+        (float(p == g), _f1(tuple(p.split()), tuple(g.split())))
+        for p, g in zip(preds_norm, gts_norm)
+    ]
@@ -27,6 +27,7 @@ class SEMAPaths:
     trajectories: Path
     pricing: Path
     logs: Path
+    llm_cache: Path
 
     _cache: ClassVar[dict[Path, 'SEMAPaths']] = {}
 
@@ -65,6 +66,7 @@ class SEMAPaths:
             trajectories=resolve('trajectories', '{root}/trajectories'),
             pricing=resolve('pricing', '{root}/pricing/model_prices.json'),
             logs=resolve('logs', '{root}/logs/sema.log'),
+            llm_cache=resolve('llm_cache', '{root}/cache/llm_cache.db'),
         )
         cls._cache[config_path] = instance
         return instance
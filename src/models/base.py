@@ -1,14 +1,53 @@
+import asyncio
+import importlib.util
 import json
+import random
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, ClassVar, Dict
+from urllib.parse import urlparse
+
+import httpx
+
+from .batching import BatchingDispatcher
+from .cache import LLMCache
+from .semantic_cache import SemanticLLMCache
+from ..utils import get_logger
+
+logger = get_logger(__name__)
+
+# Resolved once at import so the default lookup never re-resolves symlinks.
+_DEFAULT_CONFIG_FILE = (Path(__file__).resolve().parent.parent / 'config' / 'models.json').resolve()
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1.
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Upper bound on a server-requested Retry-After delay.
+_MAX_RETRY_AFTER_S = 60.0
+
+
+def is_local_url(url: str) -> bool:
+	'''Whether url points at this machine (localhost or a loopback address).
+
+	Schemeless hosts such as 'localhost:11434', which the Ollama SDK accepts,
+	are parsed as network locations rather than as a scheme.
+	'''
+	if '://' not in url and not url.startswith('//'):
+		url = '//' + url
+	return urlparse(url).hostname in ('localhost', '127.0.0.1', '::1')
 
 
 @dataclass
 class LLMConfig:
-	'''Configuration for a language model loaded from models.json.'''
+	'''Configuration for a language model loaded from models.json.
+
+	system_prompt and static_prefix are sent ahead of every prompt, in that
+	order, so providers' automatic prefix caching can reuse them across
+	calls. Keep them invariant (no timestamps or ids) and pass only the
+	per-call tail as the prompt.
+	'''
 
 	id: str
 	provider: str
@@ -16,8 +55,12 @@ class LLMConfig:
 	base_url: str
 	api_key: str
 	temperature: float | None = None
+	semantic_cache: bool = False
+	system_prompt: str | None = None
+	static_prefix: str | None = None
+	raw_client: bool = False
 	_file_cache: ClassVar[Dict[Path, Dict[str, Dict[str, Any]]]] = {}
-	_instance_cache: ClassVar[Dict[tuple[Path, str], 'LLMConfig']] = {}
+	_instance_cache: ClassVar[Dict[tuple[str, str], 'LLMConfig']] = {}
 
 	@classmethod
 	def load(cls, model: str, path: str | Path | None = None) -> 'LLMConfig':
@@ -27,16 +70,19 @@ class LLMConfig:
 			model: Model key defined in the JSON file.
 			path: Optional override path to the JSON config file.
 		'''
-		config_path = (Path(path) if path else Path(__file__).resolve().parent.parent / 'config' / 'models.json').resolve()
-		cache_key = (config_path, model)
-
+		# Check the instance cache before touching the filesystem: entries are
+		# only added after the file has been parsed and validated.
+		cache_key = (str(path) if path else '__default__', model)
 		if cache_key in cls._instance_cache:
 			return cls._instance_cache[cache_key]
 
-		if not config_path.is_file():
-			raise FileNotFoundError(f'Config file not found: {config_path}')
+		config_path = Path(path).resolve() if path else _DEFAULT_CONFIG_FILE
 
+		# The file cache is keyed by resolved path, so aliases of the same file
+		# (default vs. explicit path) share a single parse.
 		if config_path not in cls._file_cache:
+			if not config_path.is_file():
+				raise FileNotFoundError(f'Config file not found: {config_path}')
 			with config_path.open('r', encoding='utf-8') as fp:
 				cls._file_cache[config_path] = json.load(fp)
 
@@ -53,6 +99,10 @@ class LLMConfig:
 			base_url=entry.get('base_url', ''),
 			api_key=entry.get('api_key', ''),
 			temperature=entry.get('temperature', 1.0),
+			semantic_cache=entry.get('semantic_cache', False),
+			system_prompt=entry.get('system_prompt'),
+			static_prefix=entry.get('static_prefix'),
+			raw_client=entry.get('raw_client', False),
 		)
 		cls._instance_cache[cache_key] = instance
 		return instance
@@ -61,17 +111,280 @@ class LLMConfig:
 class AsyncBaseLLM(ABC):
 	'''Abstract base class for async LLM implementations.'''
 
+	# Clients shared by every wrapper on one event loop, keyed by
+	# loop_shared() key; values are (client, async closer or None).
+	_shared_loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+	_shared_clients: ClassVar[Dict[Any, tuple[Any, Callable[[Any], Awaitable[None]] | None]]] = {}
+	# Retry policy for __call__; providers narrow the exception types to
+	# transient failures (connection errors, timeouts, 429, 5xx).
+	_max_attempts: ClassVar[int] = 3
+	_retry_exceptions: ClassVar[tuple[type[BaseException], ...]] = (Exception,)
+
 	def __init__(self, config: LLMConfig) -> None:
 		self.config = config
+		# Optional near-duplicate cache; used only when config.semantic_cache is set.
+		self.semantic_cache: SemanticLLMCache | None = None
+		# Optional request coalescing; see enable_coalescing().
+		self._dispatcher: BatchingDispatcher | None = None
+
+	@staticmethod
+	def loop_shared(
+		key: Any,
+		factory: Callable[[], Any],
+		aclose: Callable[[Any], Awaitable[None]] | None = None,
+	) -> Any:
+		'''Client for key shared by every wrapper running on the current event loop.
+
+		Pooled connections belong to the loop that opened them, so the cache
+		is dropped (not reused) as soon as a different loop asks, e.g. a later
+		asyncio.run(). aclose, when given, releases the client on
+		aclose_shared_http_client(); clients without one (SDK clients over
+		shared_http_client()) are simply dropped. Must be called from a coroutine.
+		'''
+		loop = asyncio.get_running_loop()
+		if AsyncBaseLLM._shared_loop is not loop:
+			AsyncBaseLLM._shared_loop = loop
+			AsyncBaseLLM._shared_clients = {}
+		entry = AsyncBaseLLM._shared_clients.get(key)
+		if entry is None:
+			entry = AsyncBaseLLM._shared_clients[key] = (factory(), aclose)
+		return entry[0]
+
+	@staticmethod
+	def shared_http_client() -> httpx.AsyncClient:
+		'''httpx client injected into remote provider SDKs, one per event loop.
+
+		Sharing one connection pool lets concurrent calls across wrapper
+		instances reuse keep-alive connections (multiplexed over HTTP/2 when
+		`h2` is installed). Timeouts mirror the provider SDK defaults.
+		'''
+		client = AsyncBaseLLM.loop_shared('httpx', AsyncBaseLLM._new_http_client, httpx.AsyncClient.aclose)
+		if client.is_closed:
+			# Closed behind our back (e.g. by an SDK client's close()): rebuild it
+			# along with the SDK clients wrapping it, i.e. the entries with no closer
+			AsyncBaseLLM._shared_clients = {
+				key: entry for key, entry in AsyncBaseLLM._shared_clients.items()
+				if entry[1] is not None and key != 'httpx'
+			}
+			client = AsyncBaseLLM.loop_shared('httpx', AsyncBaseLLM._new_http_client, httpx.AsyncClient.aclose)
+		return client
+
+	@staticmethod
+	def _new_http_client() -> httpx.AsyncClient:
+		return httpx.AsyncClient(
+			http2=_HTTP2_AVAILABLE,
+			limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+			timeout=httpx.Timeout(600.0, connect=5.0),
+			follow_redirects=True,
+		)
+
+	@staticmethod
+	async def aclose_shared_http_client() -> None:
+		'''Close the shared clients of this event loop; call on shutdown, after the last LLM call.
+
+		Wrappers resolve their SDK client per request, so existing instances
+		(e.g. those shared through Agent._llm_registry) stay usable and reopen
+		fresh clients on their next call. Clients left behind by another loop
+		are only dropped: their connections cannot be closed from here.
+		'''
+		clients = AsyncBaseLLM._shared_clients
+		owned = AsyncBaseLLM._shared_loop is asyncio.get_running_loop()
+		AsyncBaseLLM._shared_loop = None
+		AsyncBaseLLM._shared_clients = {}
+		if owned:
+			for client, aclose in clients.values():
+				if aclose is not None:
+					await aclose(client)
 
-	@abstractmethod
 	async def __call__(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
 		'''Call the LLM asynchronously.
 
 		Returns str for non-streaming, AsyncIterator[str] for streaming
-		(when payload_override contains stream=True).
+		(when payload_override contains stream=True). Serves deterministic
+		calls from the response cache (exact, then semantic) and retries
+		transient failures with jittered exponential backoff (1s, 2s, ...
+		capped at 10s), or after the server's Retry-After delay when given.
 		'''
-		...
+		cache_key = self._cache_key(prompt, kwargs)
+		cached = await self._cached_response(cache_key)
+		if cached is not None:
+			return cached
+
+		namespace = self._semantic_namespace(kwargs)
+		embedding = None
+		if namespace is not None:
+			cached, embedding = await self.semantic_cache.lookup(namespace, prompt)
+			if cached is not None:
+				return cached
+
+		send = self._dispatcher.submit if self._dispatcher is not None else self._do_call
+		result = await self._retrying(send, prompt, **kwargs)
+
+		if isinstance(result, str):
+			await self._store_response(cache_key, result)
+			if namespace is not None:
+				self.semantic_cache.add(namespace, embedding, result)
+		return result
+
+	async def stream(self, prompt: str, **kwargs: Any) -> AsyncIterator[str]:
+		'''Stream the response as text deltas as they are generated.
+
+		A single attempt: streamed calls are neither cached nor retried, since
+		retrying after partial output would repeat it. Stop iterating to
+		abandon the generation early.
+		'''
+		chunks = await self._do_call(prompt, **self._streaming_kwargs(kwargs))
+		async for chunk in chunks:
+			yield chunk
+
+	def _streaming_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+		'''Call kwargs that request a streamed response (payload_override stream=True).'''
+		return {**kwargs, 'payload_override': {**(kwargs.get('payload_override') or {}), 'stream': True}}
+
+	def enable_coalescing(self, batch_window_ms: float = 10.0, max_batch: int = 32) -> None:
+		'''Hold concurrent calls for up to batch_window_ms and release them together.
+
+		Every call is still its own provider request, so this does not reduce
+		the number of requests or tokens; it only aligns their start times
+		(e.g. to land in the same server-side batch) at the cost of up to
+		batch_window_ms of added latency per call. Cache lookups and retries
+		still happen per call, outside the window.
+		'''
+		self._dispatcher = BatchingDispatcher(self._do_call, batch_window_ms, max_batch)
+
+	async def batch_call(self, prompts: list[str], *, max_concurrency: int = 32, **kwargs: Any) -> list[str]:
+		'''Call the LLM on many prompts concurrently.
+
+		Requests run in parallel (at most max_concurrency in flight) so the
+		server can batch them; results are returned in prompt order. Each
+		prompt goes through __call__, so caching and retries still apply.
+		'''
+		sem = asyncio.Semaphore(max(1, max_concurrency))
+
+		async def _one(prompt: str) -> str:
+			async with sem:
+				return await self(prompt, **kwargs)
+
+		return await asyncio.gather(*[_one(p) for p in prompts])
+
+	async def _do_call(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
+		'''Perform a single provider request (no caching, no retries).
+
+		Not abstract, so subclasses written against the older contract that
+		override only __call__ still instantiate; they just lose what
+		__call__ layers on top (caching, retries, stream(), coalescing).
+		'''
+		raise NotImplementedError(
+			f'{type(self).__name__} must implement _do_call() to use caching, retries, '
+			'stream() and coalescing (or override __call__ and avoid them)'
+		)
+
+	async def _retrying(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+		'''Await fn(*args, **kwargs), retrying transient failures per the class policy.'''
+		for attempt in range(self._max_attempts):
+			try:
+				return await fn(*args, **kwargs)
+			except self._retry_exceptions as exc:
+				if attempt == self._max_attempts - 1 or not self._is_retryable(exc):
+					raise
+				delay = self._retry_delay(exc, attempt)
+				logger.warning(
+					f'{self.config.id} request failed (attempt {attempt + 1}/{self._max_attempts}): '
+					f'{exc!r}; retrying in {delay:.1f}s'
+				)
+				await asyncio.sleep(delay)
+
+	def _is_retryable(self, exc: BaseException) -> bool:
+		'''Final say on whether an exception matching _retry_exceptions is retried.'''
+		return True
+
+	@staticmethod
+	def _retry_delay(exc: BaseException, attempt: int) -> float:
+		'''Backoff before the next attempt, honouring a Retry-After header (in seconds).
+
+		Exponential delays get up to 0.3s of random jitter so that callers
+		failing together do not retry in lockstep.
+		'''
+		headers = getattr(getattr(exc, 'response', None), 'headers', None)
+		retry_after = headers.get('retry-after') if headers is not None else None
+		if retry_after:
+			try:
+				return min(_MAX_RETRY_AFTER_S, max(0.0, float(retry_after)))
+			except ValueError:
+				pass  # HTTP-date form; fall back to exponential backoff
+		return min(10, 2 ** attempt) + random.uniform(0, 0.3)
+
+	def _cache_key(self, prompt: str, kwargs: Dict[str, Any]) -> str | None:
+		'''Response-cache key for a call, or None when the call must not be cached.
+
+		Caching requires ``SEMA_LLM_CACHE=1``, a non-streaming call and an
+		effective temperature of 0 (or unset).
+		'''
+		if not LLMCache.enabled():
+			return None
+		deterministic, temperature = self._deterministic_temperature(kwargs)
+		if not deterministic:
+			return None
+		return LLMCache.make_key(self.config.id, prompt, temperature, self._cache_overrides(kwargs))
+
+	def _semantic_namespace(self, kwargs: Dict[str, Any]) -> str | None:
+		'''Semantic-cache namespace for a call, or None when it must not be used.
+
+		Requires config.semantic_cache, an attached SemanticLLMCache and the
+		same deterministic conditions as the exact cache. The namespace covers
+		everything but the prompt, so matches never cross models or overrides.
+		'''
+		if not self.config.semantic_cache or self.semantic_cache is None:
+			return None
+		deterministic, temperature = self._deterministic_temperature(kwargs)
+		if not deterministic:
+			return None
+		return LLMCache.make_key(self.config.id, '', temperature, self._cache_overrides(kwargs))
+
+	def _cache_overrides(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+		'''Call kwargs plus any configured prompt prefixes, which also shape the response.'''
+		if self.config.system_prompt is None and self.config.static_prefix is None:
+			return kwargs
+		return {**kwargs, '_system_prompt': self.config.system_prompt, '_static_prefix': self.config.static_prefix}
+
+	def _chat_messages(self, prompt: str) -> list[Dict[str, str]]:
+		'''Chat messages for a prompt: system prompt, then static prefix, then the prompt.
+
+		Invariant content comes first so that provider-side prefix caches hit.
+		'''
+		if not self.config.system_prompt and not self.config.static_prefix:
+			return [{'role': 'user', 'content': prompt}]
+		messages: list[Dict[str, str]] = []
+		if self.config.system_prompt:
+			messages.append({'role': 'system', 'content': self.config.system_prompt})
+		if self.config.static_prefix:
+			messages.append({'role': 'user', 'content': self.config.static_prefix})
+		messages.append({'role': 'user', 'content': prompt})
+		return messages
+
+	def _deterministic_temperature(self, kwargs: Dict[str, Any]) -> tuple[bool, float | None]:
+		'''Return (deterministic, effective temperature): non-streamed with temperature 0 or unset.'''
+		overrides: Dict[str, Any] = kwargs.get('payload_override') or {}
+		if overrides.get('stream') or kwargs.get('stream'):
+			return False, None
+		# Temperature may be overridden per call: top-level (OpenAI-style),
+		# under 'config' (Gemini) or under 'options' (Ollama).
+		temperature = self.config.temperature
+		for section in (overrides, overrides.get('config'), kwargs.get('options')):
+			if isinstance(section, dict) and 'temperature' in section:
+				temperature = section['temperature']
+		return temperature in (None, 0, 0.0), temperature
+
+	async def _cached_response(self, cache_key: str | None) -> str | None:
+		'''Look up a cached response; always a miss when cache_key is None.'''
+		if cache_key is None:
+			return None
+		return await LLMCache.get_instance().get(cache_key)
+
+	async def _store_response(self, cache_key: str | None, content: str) -> None:
+		'''Store a response in the cache when cache_key is not None.'''
+		if cache_key is not None:
+			await LLMCache.get_instance().set(cache_key, content)
 
 	@abstractmethod
 	def _record_usage(self, response: Any) -> None:
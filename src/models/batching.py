@@ -0,0 +1,71 @@
+'''Time-aligned dispatch of concurrent LLM requests.'''
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+Send = Callable[..., Awaitable[Any]]
+
+
+class BatchingDispatcher:
+	'''Collect requests that arrive within a short window and start them together.
+
+	Each submitted request waits at most ``batch_window_ms`` (or until
+	``max_batch`` requests are pending); the collected group is then sent
+	concurrently, one ``send`` call per request, and every result, or
+	exception, is routed back to its own caller. No requests are merged, so
+	the request count is unchanged: this only aligns start times. Groups are
+	dispatched in the background, so a slow group never delays the
+	collection of the next one.
+	'''
+
+	def __init__(self, send: Send, batch_window_ms: float = 10.0, max_batch: int = 32) -> None:
+		self._send = send
+		self._window_s = batch_window_ms / 1000.0
+		self._max_batch = max(1, max_batch)
+		self._pending: list[tuple[str, dict[str, Any], asyncio.Future]] = []
+		self._full = asyncio.Event()
+		self._flusher: asyncio.Task | None = None
+		self._in_flight: set[asyncio.Task] = set()
+
+	async def submit(self, prompt: str, **kwargs: Any) -> Any:
+		'''Queue one request and wait for its result.'''
+		future = asyncio.get_running_loop().create_future()
+		self._pending.append((prompt, kwargs, future))
+		if len(self._pending) >= self._max_batch:
+			self._full.set()
+		if self._flusher is None or self._flusher.done():
+			self._flusher = asyncio.create_task(self._flush_loop())
+		return await future
+
+	async def _flush_loop(self) -> None:
+		while self._pending:
+			try:
+				await asyncio.wait_for(self._full.wait(), self._window_s)
+			except TimeoutError:
+				pass
+			self._full.clear()
+
+			batch = self._pending[:self._max_batch]
+			self._pending = self._pending[self._max_batch:]
+			if len(self._pending) >= self._max_batch:
+				self._full.set()
+
+			task = asyncio.create_task(self._dispatch(batch))
+			self._in_flight.add(task)
+			task.add_done_callback(self._in_flight.discard)
+
+	async def _dispatch(self, batch: list[tuple[str, dict[str, Any], asyncio.Future]]) -> None:
+		results = await asyncio.gather(
+			*(self._send(prompt, **kwargs) for prompt, kwargs, _ in batch),
+			return_exceptions=True,
+		)
+		for (_, _, future), result in zip(batch, results):
+			if future.done():
+				continue  # caller was cancelled while waiting
+			if isinstance(result, BaseException):
+				future.set_exception(result)
+			else:
+				future.set_result(result)
@@ -0,0 +1,242 @@
+'''Opt-in cache for deterministic LLM responses.
+
+Enabled by setting ``SEMA_LLM_CACHE``: ``1``/``true``/``sqlite`` persist to
+SQLite, ``memory`` keeps a per-process TTL/LRU map and ``redis`` uses the
+server at ``SEMA_LLM_CACHE_URL``. Only calls whose effective temperature is
+0 (or unset) and that are not streamed are cached; the key is a digest
+(BLAKE3 when installed, else SHA-256) over (model, prompt, temperature,
+overrides), where overrides carry any per-call messages, tools or payload
+tweaks.
+'''
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+from ..config.paths import SEMAPaths
+from ..utils import get_logger
+
+try:
+	import orjson
+except ImportError:  # optional: faster canonical JSON for cache keys
+	orjson = None
+
+try:
+	from blake3 import blake3 as _hash
+except ImportError:  # optional: SIMD hash; keys need no cryptographic strength
+	_hash = hashlib.sha256
+
+logger = get_logger(__name__)
+
+_ENV_FLAG = 'SEMA_LLM_CACHE'
+_ENV_URL = 'SEMA_LLM_CACHE_URL'
+_DEFAULT_TTL_S = 7 * 24 * 3600.0
+
+
+class CacheBackend(Protocol):
+	'''Storage used by LLMCache; expired entries must read as misses.'''
+
+	async def get(self, key: str) -> str | None: ...
+
+	async def set(self, key: str, value: str) -> None: ...
+
+	def close(self) -> None: ...
+
+
+class SQLiteBackend:
+	'''On-disk backend shared by every process using the same database file.
+
+	Blocking sqlite3 calls run in a worker thread via ``asyncio.to_thread``;
+	a lock serialises access to the single shared connection.
+	'''
+
+	def __init__(self, db_path: Path | None = None, ttl_s: float = _DEFAULT_TTL_S) -> None:
+		self._db_path = Path(db_path) if db_path else SEMAPaths.load().llm_cache
+		self._ttl_s = ttl_s
+		self._lock = threading.Lock()
+		self._db_path.parent.mkdir(parents=True, exist_ok=True)
+		self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+		with self._lock, self._conn:
+			self._conn.execute(
+				'CREATE TABLE IF NOT EXISTS responses ('
+				'key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)'
+			)
+
+	def _get_sync(self, key: str) -> str | None:
+		with self._lock:
+			row = self._conn.execute(
+				'SELECT value, created FROM responses WHERE key = ?', (key,)
+			).fetchone()
+		if row is None:
+			return None
+		value, created = row
+		if time.time() - created > self._ttl_s:
+			return None
+		return value
+
+	def _set_sync(self, key: str, value: str) -> None:
+		with self._lock, self._conn:
+			self._conn.execute(
+				'INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)',
+				(key, value, time.time()),
+			)
+
+	async def get(self, key: str) -> str | None:
+		return await asyncio.to_thread(self._get_sync, key)
+
+	async def set(self, key: str, value: str) -> None:
+		await asyncio.to_thread(self._set_sync, key, value)
+
+	def close(self) -> None:
+		with self._lock:
+			self._conn.close()
+
+
+class MemoryBackend:
+	'''In-process backend with TTL expiry and least-recently-used eviction.'''
+
+	def __init__(self, maxsize: int = 4096, ttl_s: float = _DEFAULT_TTL_S) -> None:
+		self._maxsize = maxsize
+		self._ttl_s = ttl_s
+		self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+	async def get(self, key: str) -> str | None:
+		entry = self._entries.get(key)
+		if entry is None:
+			return None
+		value, created = entry
+		if time.monotonic() - created > self._ttl_s:
+			del self._entries[key]
+			return None
+		self._entries.move_to_end(key)
+		return value
+
+	async def set(self, key: str, value: str) -> None:
+		self._entries[key] = (value, time.monotonic())
+		self._entries.move_to_end(key)
+		while len(self._entries) > self._maxsize:
+			self._entries.popitem(last=False)
+
+	def close(self) -> None:
+		self._entries.clear()
+
+
+class RedisBackend:
+	'''Shared backend on a Redis server; requires the optional ``redis`` package.'''
+
+	def __init__(self, url: str = 'redis://localhost:6379/0', ttl_s: float = _DEFAULT_TTL_S) -> None:
+		try:
+			import redis.asyncio as redis
+		except ImportError as exc:
+			raise ImportError('RedisBackend requires the `redis` package') from exc
+		self._client = redis.from_url(url, decode_responses=True)
+		self._ttl_s = ttl_s
+
+	async def get(self, key: str) -> str | None:
+		return await self._client.get(key)
+
+	async def set(self, key: str, value: str) -> None:
+		await self._client.set(key, value, ex=max(1, int(self._ttl_s)))
+
+	def close(self) -> None:
+		# The connection pool is released when the client is garbage collected;
+		# closing it here would need a running event loop.
+		self._client = None
+
+
+class LLMCache:
+	'''Response cache shared by all LLM wrappers.
+
+	Backend failures are logged and treated as misses so a broken cache
+	never fails an LLM call. Hit/miss counts are kept for diagnostics.
+	'''
+
+	_instance: LLMCache | None = None
+	_init_lock: threading.Lock = threading.Lock()
+
+	def __init__(
+		self,
+		db_path: Path | None = None,
+		ttl_s: float = _DEFAULT_TTL_S,
+		backend: CacheBackend | None = None,
+	) -> None:
+		self._backend: CacheBackend = backend if backend is not None else SQLiteBackend(db_path, ttl_s)
+		self.hits = 0
+		self.misses = 0
+
+	@classmethod
+	def get_instance(cls) -> LLMCache:
+		'''Return the global cache, creating it on first call.
+
+		The backend is chosen from the ``SEMA_LLM_CACHE`` env var.
+		'''
+		if cls._instance is None:
+			with cls._init_lock:
+				if cls._instance is None:
+					mode = os.environ.get(_ENV_FLAG, '').lower()
+					if mode == 'memory':
+						backend: CacheBackend = MemoryBackend()
+					elif mode == 'redis':
+						backend = RedisBackend(os.environ.get(_ENV_URL, 'redis://localhost:6379/0'))
+					else:
+						backend = SQLiteBackend()
+					cls._instance = cls(backend=backend)
+		return cls._instance
+
+	@staticmethod
+	def enabled() -> bool:
+		'''Whether caching is switched on via the ``SEMA_LLM_CACHE`` env var.'''
+		return os.environ.get(_ENV_FLAG, '').lower() in ('1', 'true', 'yes', 'sqlite', 'memory', 'redis')
+
+	@staticmethod
+	def make_key(model: str, prompt: str, temperature: float | None, overrides: dict[str, Any] | None = None) -> str:
+		'''Digest over the canonical JSON of everything that shapes the response.
+
+		Uses orjson and BLAKE3 when installed, else stdlib json and SHA-256;
+		processes sharing a cache store should have the same optional packages.
+		'''
+		payload = {'m': model, 'p': prompt, 't': temperature, 'o': overrides or {}}
+		if orjson is not None:
+			blob = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+		else:
+			blob = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+		return _hash(blob).hexdigest()
+
+	def stats(self) -> dict[str, float]:
+		'''Hit/miss counters and hit rate since the cache was created.'''
+		total = self.hits + self.misses
+		return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0}
+
+	async def get(self, key: str) -> str | None:
+		'''Return the cached response for ``key``, or None on miss/expiry.'''
+		try:
+			value = await self._backend.get(key)
+		except Exception as exc:
+			logger.warning(f'LLM cache read failed: {exc}')
+			value = None
+		if value is None:
+			self.misses += 1
+		else:
+			self.hits += 1
+			logger.debug(f'LLM cache hit ({self.hits} hits / {self.misses} misses)')
+		return value
+
+	async def set(self, key: str, value: str) -> None:
+		'''Store ``value`` under ``key``.'''
+		try:
+			await self._backend.set(key, value)
+		except Exception as exc:
+			logger.warning(f'LLM cache write failed: {exc}')
+
+	def close(self) -> None:
+		'''Release resources held by the backend.'''
+		self._backend.close()
@@ -1,14 +1,22 @@
 from collections.abc import AsyncIterator
 from typing import Any, Dict
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import anthropic
 from anthropic import AsyncAnthropic
 from .base import LLMConfig, AsyncBaseLLM
 from .model_usage import ModelUsage
 
+# Prompt-caching breakpoint (default 5 minute TTL)
+_EPHEMERAL: Dict[str, str] = {'type': 'ephemeral'}
+
 
 class AsyncAnthropicLLM(AsyncBaseLLM):
 	'''Async wrapper for Anthropic Claude API.'''
 
+	# APITimeoutError is a subclass of APIConnectionError. APIStatusError
+	# covers every HTTP error (including 529 overloaded, which is not an
+	# InternalServerError) and is narrowed in _is_retryable.
+	_retry_exceptions = (anthropic.APIConnectionError, anthropic.APIStatusError)
+
 	def __init__(
 		self,
 		config: LLMConfig,
@@ -16,19 +24,44 @@ class AsyncAnthropicLLM(AsyncBaseLLM):
 		client: AsyncAnthropic | None = None,
 	) -> None:
 		super().__init__(config)
-		self._client = client or AsyncAnthropic(
-			api_key=self.config.api_key or None,
-			base_url=self.config.base_url or None,
+		self._injected_client = client
+
+	@property
+	def _client(self) -> AsyncAnthropic:
+		'''The injected client, else the SDK client shared per endpoint and key on this event loop.'''
+		if self._injected_client is not None:
+			return self._injected_client
+		# Resolve the pool first: a rebuilt pool also drops the SDK clients over the old one
+		http_client = self.shared_http_client()
+		base_url, api_key = self.config.base_url, self.config.api_key
+		return self.loop_shared(
+			('anthropic', base_url, api_key),
+			lambda: AsyncAnthropic(
+				api_key=api_key or None,
+				base_url=base_url or None,
+				http_client=http_client,
+			),
 		)
 
-	@retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), retry=retry_if_exception_type(Exception))
-	async def __call__(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
+	async def _do_call(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
 		'''Call the Anthropic Claude LLM. Returns str or AsyncIterator[str] for streaming.'''
+		# Static prefix and prompt share one user turn; Anthropic takes the
+		# system prompt as a top-level parameter. Anthropic caches only
+		# prefixes ending at a cache_control breakpoint, so mark the last
+		# static block of each.
+		content: str | list[Dict[str, Any]] = prompt
+		if self.config.static_prefix:
+			content = [
+				{'type': 'text', 'text': self.config.static_prefix, 'cache_control': _EPHEMERAL},
+				{'type': 'text', 'text': prompt},
+			]
 		payload: Dict[str, Any] = {
 			'model': self.config.id,
-			'messages': [{'role': 'user', 'content': prompt}],
+			'messages': [{'role': 'user', 'content': content}],
 			'max_tokens': 4096,
 		}
+		if self.config.system_prompt:
+			payload['system'] = [{'type': 'text', 'text': self.config.system_prompt, 'cache_control': _EPHEMERAL}]
 		if self.config.temperature is not None:
 			payload['temperature'] = self.config.temperature
 
@@ -49,6 +82,12 @@ class AsyncAnthropicLLM(AsyncBaseLLM):
 		self._record_usage(response)
 		return self._extract_content(response)
 
+	def _is_retryable(self, exc: BaseException) -> bool:
+		'''Retry connection failures and 429/5xx responses, not other 4xx errors.'''
+		if isinstance(exc, anthropic.APIStatusError):
+			return exc.status_code == 429 or exc.status_code >= 500
+		return True
+
 	def _record_usage(self, response: Any) -> None:
 		'''Extract usage from Anthropic response and record to ModelUsage.'''
 		usage = getattr(response, 'usage', None)
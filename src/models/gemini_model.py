@@ -1,14 +1,29 @@
 from collections.abc import AsyncIterator
 from typing import Any, Dict
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import httpx
 from google import genai
+from google.genai import errors
 from .base import LLMConfig, AsyncBaseLLM
 from .model_usage import ModelUsage
 
+try:
+	import aiohttp
+except ImportError:  # optional: genai falls back to httpx for async calls
+	aiohttp = None
+
 
 class AsyncGeminiLLM(AsyncBaseLLM):
 	'''Async wrapper for Google Gemini API.'''
 
+	# ClientError covers all 4xx and is narrowed to 429 in _is_retryable;
+	# connection failures surface from whichever transport genai picked.
+	_retry_exceptions = (
+		errors.ServerError,
+		errors.ClientError,
+		httpx.TransportError,
+		TimeoutError,
+	) + ((aiohttp.ClientError,) if aiohttp is not None else ())
+
 	def __init__(
 		self,
 		config: LLMConfig,
@@ -18,24 +33,21 @@ class AsyncGeminiLLM(AsyncBaseLLM):
 		super().__init__(config)
 		self._client = client or genai.Client(api_key=self.config.api_key or None)
 
-	@retry(
-		reraise=True,
-		stop=stop_after_attempt(3),
-		wait=wait_exponential(multiplier=1, min=1, max=10),
-		retry=retry_if_exception_type(Exception),
-	)
-	async def __call__(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
+	async def _do_call(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
 		'''Call the Gemini LLM. Returns str or AsyncIterator[str] for streaming.'''
 		payload: Dict[str, Any] = {
 			'model': self.config.id,
-			'contents': prompt,
+			'contents': [self.config.static_prefix, prompt] if self.config.static_prefix else prompt,
 		}
 
 		config_dict: Dict[str, Any] = {}
 		if self.config.temperature is not None:
 			config_dict['temperature'] = self.config.temperature
+		if self.config.system_prompt:
+			config_dict['system_instruction'] = self.config.system_prompt
 
-		payload_override: Dict[str, Any] = kwargs.pop('payload_override', {})
+		# Copy: keys are popped below and the caller's dict must survive retries
+		payload_override: Dict[str, Any] = dict(kwargs.pop('payload_override', {}))
 		config_dict.update(payload_override.pop('config', {}))
 
 		if config_dict:
@@ -67,6 +79,12 @@ class AsyncGeminiLLM(AsyncBaseLLM):
 		self._record_usage(response)
 		return self._extract_content(response)
 
+	def _is_retryable(self, exc: BaseException) -> bool:
+		'''Retry connection failures, 429 and 5xx responses, not other 4xx errors.'''
+		if isinstance(exc, errors.ClientError):
+			return exc.code == 429
+		return True
+
 	def _record_usage(self, response: Any) -> None:
 		'''Extract usage from Gemini response and record to ModelUsage.'''
 		um = getattr(response, 'usage_metadata', None)
@@ -1,10 +1,9 @@
-import os
 from collections.abc import AsyncIterator
 from typing import Any, Dict
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from openai import AsyncOpenAI
-from .base import LLMConfig, AsyncBaseLLM
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from .base import LLMConfig, AsyncBaseLLM, is_local_url
 from .model_usage import ModelUsage
+from .openai_model import _SDK_RETRY_EXCEPTIONS
 
 
 class AsyncMLXLLM(AsyncBaseLLM):
@@ -14,6 +13,9 @@ class AsyncMLXLLM(AsyncBaseLLM):
 	otherwise mlx_lm.server will treat it as a new HF repo and try to download it.
 	'''
 
+	# Same SDK as AsyncOpenAILLM, so the same transient errors
+	_retry_exceptions = _SDK_RETRY_EXCEPTIONS
+
 	def __init__(
 		self,
 		config: LLMConfig,
@@ -24,23 +26,18 @@ class AsyncMLXLLM(AsyncBaseLLM):
 
 		base_url = self.config.base_url or 'http://localhost:8080/v1'
 
-		no_proxy = os.environ.get('NO_PROXY', '')
-		if 'localhost' not in no_proxy and '127.0.0.1' not in no_proxy:
-			entries = [e for e in no_proxy.split(',') if e]
-			entries.extend(['localhost', '127.0.0.1'])
-			os.environ['NO_PROXY'] = ','.join(entries)
-
+		# Local servers bypass proxy environment variables without touching os.environ
 		self._client = client or AsyncOpenAI(
 			api_key=self.config.api_key or 'mlx',
 			base_url=base_url,
+			http_client=DefaultAsyncHttpxClient(trust_env=not is_local_url(base_url)),
 		)
 
-	@retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), retry=retry_if_exception_type(Exception))
-	async def __call__(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
+	async def _do_call(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
 		'''Call mlx_lm.server. Returns str or AsyncIterator[str] for streaming.'''
 		payload: Dict[str, Any] = {
 			'model': self.config.id,
-			'messages': [{'role': 'user', 'content': prompt}],
+			'messages': self._chat_messages(prompt),
 			'temperature': self.config.temperature,
 		}
 
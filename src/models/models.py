@@ -1,32 +1,31 @@
 '''Async LLM helpers backed by JSON configuration.'''
 
+import importlib
 from pathlib import Path
 from typing import Any, ClassVar, Dict, Type
 from .base import LLMConfig, AsyncBaseLLM
-from .claude_model import AsyncAnthropicLLM
-from .openai_model import AsyncOpenAILLM
-from .ollama_model import AsyncOllamaLLM
-from .gemini_model import AsyncGeminiLLM
-from .zhipu_model import AsyncZhipuLLM
-from .mlx_model import AsyncMLXLLM
 
 
 class AsyncLLM:
 	'''Factory class for creating async LLM instances based on provider.'''
 
-	_provider_registry: ClassVar[Dict[str, Type[AsyncBaseLLM]]] = {
-		'openai': AsyncOpenAILLM,
-		'azure': AsyncOpenAILLM,
-		'azure_openai': AsyncOpenAILLM,
-		'ollama': AsyncOllamaLLM,
-		'mlx': AsyncMLXLLM,
-		'gemini': AsyncGeminiLLM,
-		'google': AsyncGeminiLLM,
-		'claude': AsyncAnthropicLLM,
-		'anthropic': AsyncAnthropicLLM,
-		'zhipu': AsyncZhipuLLM,
-		'zhipuai': AsyncZhipuLLM,
+	# Provider implementations are imported on first use so that only the
+	# vendor SDK actually needed is loaded.
+	_provider_modules: ClassVar[Dict[str, tuple[str, str]]] = {
+		'openai': ('.openai_model', 'AsyncOpenAILLM'),
+		'azure': ('.openai_model', 'AsyncOpenAILLM'),
+		'azure_openai': ('.openai_model', 'AsyncOpenAILLM'),
+		'ollama': ('.ollama_model', 'AsyncOllamaLLM'),
+		'mlx': ('.mlx_model', 'AsyncMLXLLM'),
+		'gemini': ('.gemini_model', 'AsyncGeminiLLM'),
+		'google': ('.gemini_model', 'AsyncGeminiLLM'),
+		'claude': ('.claude_model', 'AsyncAnthropicLLM'),
+		'anthropic': ('.claude_model', 'AsyncAnthropicLLM'),
+		'zhipu': ('.zhipu_model', 'AsyncZhipuLLM'),
+		'zhipuai': ('.zhipu_model', 'AsyncZhipuLLM'),
 	}
+	# Resolved and custom-registered implementations.
+	_provider_registry: ClassVar[Dict[str, Type[AsyncBaseLLM]]] = {}
 
 	def __new__(
 		cls,
@@ -48,17 +47,32 @@ class AsyncLLM:
 		config = LLMConfig.load(model, path=config_path)
 		provider = config.provider.lower()
 
-		llm_class = cls._provider_registry.get(provider)
-		if llm_class is None:
+		if provider not in cls._provider_registry and provider not in cls._provider_modules:
 			# Default to OpenAI-compatible API for unknown providers
-			llm_class = AsyncOpenAILLM
+			provider = 'openai'
 
-		return llm_class(config, **kwargs)
+		return cls._resolve_provider(provider)(config, **kwargs)
+
+	@classmethod
+	def _resolve_provider(cls, provider: str) -> Type[AsyncBaseLLM]:
+		'''Return the LLM class for a provider, importing its module on first use.'''
+		llm_class = cls._provider_registry.get(provider)
+		if llm_class is None:
+			module_name, class_name = cls._provider_modules[provider]
+			module = importlib.import_module(module_name, package=__package__)
+			llm_class = getattr(module, class_name)
+			cls._provider_registry[provider] = llm_class
+		return llm_class
 
 	@classmethod
 	def register_provider(cls, provider: str, llm_class: Type[AsyncBaseLLM]) -> None:
 		'''Register a custom LLM implementation for a provider.
 
+		Implementations should override _do_call() (one provider request) and
+		inherit __call__, which adds caching and retries. Classes that only
+		override __call__ still work but skip those, and cannot use stream()
+		or coalescing.
+
 		Args:
 			provider: Provider name (case-insensitive).
 			llm_class: LLM class that extends AsyncBaseLLM.
@@ -1,14 +1,23 @@
-import os
 from collections.abc import AsyncIterator
 from typing import Any, Dict
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from ollama import AsyncClient as AsyncOllama
-from .base import LLMConfig, AsyncBaseLLM
+import httpx
+from ollama import AsyncClient as AsyncOllama, ResponseError
+from .base import LLMConfig, AsyncBaseLLM, is_local_url
 from .model_usage import ModelUsage
 
 
+async def _aclose_client(client: AsyncOllama) -> None:
+	# AsyncClient has no close() in ollama 0.6; release its httpx pool directly
+	await client._client.aclose()
+
+
 class AsyncOllamaLLM(AsyncBaseLLM):
-	'''Async wrapper for Ollama local models using official SDK with proxy bypass.'''
+	'''Async wrapper for Ollama local models using official SDK with proxy bypass for local hosts.'''
+
+	# The SDK raises ConnectionError only for httpx.ConnectError; other
+	# transport failures (read errors, dropped connections, timeouts) surface
+	# as raw httpx errors.
+	_retry_exceptions = (ResponseError, ConnectionError, httpx.TransportError)
 
 	def __init__(
 		self,
@@ -18,26 +27,35 @@ class AsyncOllamaLLM(AsyncBaseLLM):
 	) -> None:
 		super().__init__(config)
 
-		if client:
-			self._client = client
-		else:
-			# Parse host from base_url if provided, otherwise use default localhost:11434
-			host = 'http://localhost:11434'
-			if self.config.base_url:
-				# Remove /v1 suffix if present (OpenAI compatibility endpoint)
-				host = self.config.base_url.rstrip('/').removesuffix('/v1')
-
-			# Set NO_PROXY to bypass system proxy for localhost
-			no_proxy = os.environ.get('NO_PROXY', '')
-			if 'localhost' not in no_proxy and '127.0.0.1' not in no_proxy:
-				entries = [e for e in no_proxy.split(',') if e]
-				entries.extend(['localhost', '127.0.0.1'])
-				os.environ['NO_PROXY'] = ','.join(entries)
-
-			self._client = AsyncOllama(host=host)
-
-	@retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), retry=retry_if_exception_type(Exception))
-	async def __call__(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
+		# The SDK always returns a ChatResponse, so pick the direct accessor
+		# once; injected clients may return other shapes and get the general path.
+		self._extract = self._extract_content if client else self._extract_chat_response
+
+		self._injected_client = client
+		# Parse host from base_url if provided, otherwise use default localhost:11434
+		self._host = 'http://localhost:11434'
+		if self.config.base_url:
+			# Remove /v1 suffix if present (OpenAI compatibility endpoint)
+			self._host = self.config.base_url.rstrip('/').removesuffix('/v1')
+
+	@property
+	def _client(self) -> AsyncOllama:
+		'''The injected client, else one SDK client (and connection pool) per host on this event loop.
+
+		Local hosts ignore proxy environment variables (trust_env=False) so a
+		system proxy never intercepts loopback traffic; remote hosts keep them.
+		The client is closed by aclose_shared_http_client().
+		'''
+		if self._injected_client is not None:
+			return self._injected_client
+		host = self._host
+		return self.loop_shared(
+			('ollama', host),
+			lambda: AsyncOllama(host=host, trust_env=not is_local_url(host)),
+			_aclose_client,
+		)
+
+	async def _do_call(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
 		'''Call Ollama LLM. Returns str or AsyncIterator[str] for streaming.'''
 		# Build options dict for Ollama
 		options: Dict[str, Any] = {}
@@ -49,7 +67,7 @@ class AsyncOllamaLLM(AsyncBaseLLM):
 		options.update(options_override)
 
 		# Build messages format
-		messages = [{'role': 'user', 'content': prompt}]
+		messages = self._chat_messages(prompt)
 		messages_override = kwargs.pop('messages', None)
 		if messages_override:
 			messages = messages_override
@@ -99,7 +117,17 @@ class AsyncOllamaLLM(AsyncBaseLLM):
 		)
 
 		self._record_usage(response)
-		return self._extract_content(response)
+		return self._extract(response)
+
+	def _streaming_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+		'''Ollama takes stream=True as a top-level chat() argument.'''
+		return {**kwargs, 'stream': True}
+
+	def _is_retryable(self, exc: BaseException) -> bool:
+		'''Retry connection failures and 429/5xx responses, not other 4xx errors.'''
+		if isinstance(exc, ResponseError):
+			return exc.status_code == 429 or exc.status_code >= 500
+		return True
 
 	def _record_usage(self, response: Any) -> None:
 		'''Extract usage from Ollama response and record to ModelUsage.'''
@@ -111,6 +139,15 @@ class AsyncOllamaLLM(AsyncBaseLLM):
 			completion_tokens = getattr(response, 'eval_count', 0) or 0
 		ModelUsage.get_instance().record(self.config.id, prompt_tokens, completion_tokens)
 
+	@classmethod
+	def _extract_chat_response(cls, response: Any) -> str:
+		'''Fast path for SDK ChatResponse objects; falls back to _extract_content.'''
+		try:
+			content = response.message.content
+		except AttributeError:
+			content = None
+		return content if content else cls._extract_content(response)
+
 	@staticmethod
 	def _extract_content(response: Any) -> str:
 		'''Extract content from Ollama ChatResponse.'''
@@ -1,37 +1,134 @@
+import json
+import os
 from collections.abc import AsyncIterator
 from typing import Any, Dict
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import httpx
+import openai
 from openai import AsyncOpenAI
 from .base import LLMConfig, AsyncBaseLLM
 from .model_usage import ModelUsage
 
+try:
+	import msgspec
+except ImportError:  # optional: decode raw responses without building pydantic models
+	msgspec = None
+
+try:
+	import orjson
+except ImportError:  # optional: faster request encoding in raw_client mode
+	orjson = None
+
+if msgspec is not None:
+	# Only the fields read by _extract_completion and _record_usage; msgspec
+	# skips everything else in the payload. Types stay as loose as the SDK
+	# models (null usage counts, content as a list of parts) so a completed
+	# call never fails on decoding alone.
+	class _Message(msgspec.Struct):
+		content: Any = None
+
+	class _Choice(msgspec.Struct):
+		message: _Message | None = None
+		text: Any = None
+
+	class _Usage(msgspec.Struct):
+		prompt_tokens: int | None = None
+		completion_tokens: int | None = None
+
+	class _ChatResponse(msgspec.Struct):
+		choices: list[_Choice] = []
+		usage: _Usage | None = None
+
+	_decode_chat_response = msgspec.json.Decoder(_ChatResponse).decode
+
+# Transient failures raised by the OpenAI SDK, shared with other
+# OpenAI-compatible wrappers (mlx_model). APITimeoutError is a subclass of
+# APIConnectionError.
+_SDK_RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+	openai.APIConnectionError,
+	openai.RateLimitError,
+	openai.InternalServerError,
+)
+
+
+def _try_decode_chat_response(content: bytes) -> Any | None:
+	'''Decode into the msgspec Structs; None without msgspec or when the body does not fit them.'''
+	if msgspec is None:
+		return None
+	try:
+		return _decode_chat_response(content)
+	except (msgspec.DecodeError, msgspec.ValidationError):
+		return None
+
 
 class AsyncOpenAILLM(AsyncBaseLLM):
 	'''Async wrapper for OpenAI-compatible APIs.'''
 
+	# The httpx errors come from raw_client mode and are narrowed to 429/5xx
+	# in _is_retryable.
+	_retry_exceptions = _SDK_RETRY_EXCEPTIONS + (httpx.TransportError, httpx.HTTPStatusError)
+
 	def __init__(
 		self,
 		config: LLMConfig,
 		*,
 		client: AsyncOpenAI | None = None,
+		coalesce: bool = False,
+		batch_window_ms: float = 10.0,
+		max_batch: int = 32,
 	) -> None:
 		super().__init__(config)
-		self._client = client or AsyncOpenAI(
-			api_key=self.config.api_key or None,
-			base_url=self.config.base_url or None,
-		)
-
-	@retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), retry=retry_if_exception_type(Exception))
-	async def __call__(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
-		'''Call the LLM. Returns str (non-streaming) or AsyncIterator[str] (streaming).'''
-		payload: Dict[str, Any] = {
+		self._injected_client = client
+		# The SDK always returns a ChatCompletion, so pick the direct accessor
+		# once; injected clients may return other shapes and get the general path.
+		self._extract = self._extract_content if client else self._extract_completion
+		# With msgspec, SDK clients fetch the raw body and decode only the
+		# fields we use instead of validating a full ChatCompletion.
+		self._decode_raw = msgspec is not None and client is None
+		# Config-only part of every request, merged (not rebuilt) per call
+		self._base_payload: Dict[str, Any] = {
 			'model': self.config.id,
-			'messages': [{'role': 'user', 'content': prompt}],
 			'temperature': self.config.temperature,
 		}
+		# Opt-in raw HTTP mode (config.raw_client): non-streamed calls POST
+		# straight to /chat/completions on the shared httpx pool, skipping the
+		# SDK's request building and response models. Streaming keeps the SDK.
+		self._raw_url: str | None = None
+		if self.config.raw_client and client is None:
+			base_url = (self.config.base_url or 'https://api.openai.com/v1').rstrip('/')
+			api_key = self.config.api_key or os.environ.get('OPENAI_API_KEY', '')
+			self._raw_url = f'{base_url}/chat/completions'
+			self._raw_headers = {'Authorization': f'Bearer {api_key}', 'Content-Type': 'application/json'}
+		if coalesce:
+			self.enable_coalescing(batch_window_ms, max_batch)
 
-		payload_override: Dict[str, Any] = kwargs.pop('payload_override', {})
-		payload.update(payload_override)
+	@property
+	def _client(self) -> AsyncOpenAI:
+		'''The injected client, else the SDK client shared per endpoint and key on this event loop.
+
+		Resolved per request so long-lived wrappers follow the shared pool
+		across aclose_shared_http_client() and successive asyncio.run() calls.
+		'''
+		if self._injected_client is not None:
+			return self._injected_client
+		# Resolve the pool first: a rebuilt pool also drops the SDK clients over the old one
+		http_client = self.shared_http_client()
+		base_url, api_key = self.config.base_url, self.config.api_key
+		return self.loop_shared(
+			('openai', base_url, api_key),
+			lambda: AsyncOpenAI(
+				api_key=api_key or None,
+				base_url=base_url or None,
+				http_client=http_client,
+			),
+		)
+
+	async def _do_call(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
+		'''Call the LLM. Returns str (non-streaming) or AsyncIterator[str] (streaming).'''
+		payload: Dict[str, Any] = {**self._base_payload, 'messages': self._chat_messages(prompt)}
+
+		payload_override: Dict[str, Any] = kwargs.pop('payload_override', None)
+		if payload_override:
+			payload.update(payload_override)
 
 		if payload.get('stream'):
 			stream_payload = {**payload, 'stream_options': {'include_usage': True}}
@@ -48,19 +145,57 @@ class AsyncOpenAILLM(AsyncBaseLLM):
 
 			return _gen()
 
-		response = await self._client.chat.completions.create(**payload)
+		if self._raw_url is not None:
+			response = await self._raw_call(payload)
+		elif self._decode_raw:
+			raw = await self._client.chat.completions.with_raw_response.create(**payload)
+			response = _try_decode_chat_response(raw.content)
+			if response is None:
+				response = raw.parse()
+		else:
+			response = await self._client.chat.completions.create(**payload)
 		self._record_usage(response)
-		return self._extract_content(response)
+		return self._extract(response)
+
+	async def _raw_call(self, payload: Dict[str, Any]) -> Any:
+		'''POST a chat completion over raw httpx; returns a msgspec Struct or a dict.'''
+		body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+		response = await self.shared_http_client().post(self._raw_url, content=body, headers=self._raw_headers)
+		response.raise_for_status()
+		decoded = _try_decode_chat_response(response.content)
+		if decoded is not None:
+			return decoded
+		return orjson.loads(response.content) if orjson is not None else json.loads(response.content)
+
+	def _is_retryable(self, exc: BaseException) -> bool:
+		'''Raw-mode HTTP errors are retried only for 429/5xx, like the SDK's error classes.'''
+		if isinstance(exc, httpx.HTTPStatusError):
+			status = exc.response.status_code
+			return status == 429 or status >= 500
+		return True
 
 	def _record_usage(self, response: Any) -> None:
 		'''Extract usage from response and record to ModelUsage.'''
-		usage = getattr(response, 'usage', None)
-		if usage is None:
+		usage = response.get('usage') if isinstance(response, dict) else getattr(response, 'usage', None)
+		if not usage:
 			return
-		prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
-		completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+		if isinstance(usage, dict):
+			prompt_tokens = usage.get('prompt_tokens', 0) or 0
+			completion_tokens = usage.get('completion_tokens', 0) or 0
+		else:
+			prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+			completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
 		ModelUsage.get_instance().record(self.config.id, prompt_tokens, completion_tokens)
 
+	@classmethod
+	def _extract_completion(cls, response: Any) -> str:
+		'''Fast path for SDK ChatCompletion objects; falls back to _extract_content.'''
+		try:
+			content = response.choices[0].message.content
+		except (AttributeError, IndexError):
+			content = None
+		return content if content and isinstance(content, str) else cls._extract_content(response)
+
 	@staticmethod
 	def _extract_content(response: Any) -> str:
 		choices = getattr(response, 'choices', None)
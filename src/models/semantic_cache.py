@@ -0,0 +1,242 @@
+'''In-memory semantic cache for deterministic LLM responses.
+
+Complements the exact-match ``LLMCache``: a prompt is embedded once and
+compared by cosine similarity against previously answered prompts; when the
+best match clears ``threshold`` its response is reused. Entries are grouped
+by namespace (model, temperature and per-call overrides) so near-duplicate
+prompts only match under otherwise identical settings.
+
+Attach an instance to an LLM (``llm.semantic_cache = SemanticLLMCache(embed)``)
+and set ``"semantic_cache": true`` on its models.json entry to enable it.
+'''
+
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from ..utils import get_logger
+
+try:
+	import numpy as np
+except ImportError:  # optional: pure-Python scan over the same buffer layout
+	np = None
+
+logger = get_logger(__name__)
+
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
+
+def _normalize(vector: Sequence[float]) -> Any:
+	'''Scale vector to unit length as float32 (ndarray or array('f')); None for a zero vector.'''
+	if np is not None:
+		vec = np.asarray(vector, dtype=np.float32)
+		norm = float(np.linalg.norm(vec))
+		return vec / norm if norm else None
+	norm = math.sqrt(math.fsum(x * x for x in vector))
+	return array('f', (x / norm for x in vector)) if norm else None
+
+
+def openai_embedder(client: Any, model: str = 'text-embedding-3-small') -> Embedder:
+	'''Build an embedder backed by an OpenAI-compatible embeddings endpoint.'''
+
+	async def _embed(text: str) -> Sequence[float]:
+		response = await client.embeddings.create(model=model, input=text)
+		return response.data[0].embedding
+
+	return _embed
+
+
+def _quantize(embedding: Any) -> tuple[Any, float]:
+	'''Symmetric int8 quantization: (int8 values, scale) with value * scale ~ embedding.'''
+	if np is not None:
+		peak = float(np.abs(embedding).max())
+		scale = peak / 127.0 if peak else 1.0
+		return np.round(embedding / scale).astype(np.int8), scale
+	peak = max(map(abs, embedding))
+	scale = peak / 127.0 if peak else 1.0
+	return array('b', (round(x / scale) for x in embedding)), scale
+
+
+class EmbeddingStore:
+	'''Unit-length embeddings in one contiguous row-major matrix.
+
+	Rows live in a single buffer (an ``(N, D)`` ndarray when numpy is
+	installed, a flat ``array`` otherwise) beside a parallel list of
+	responses, so a query is one matrix-vector product rather than a loop
+	over per-entry vectors. Capacity doubles as needed; once ``max_entries``
+	rows are stored the oldest row is overwritten.
+
+	With ``quantize=True`` rows are stored as symmetric int8 with a float32
+	scale per row (4x smaller than float32); similarities then carry an
+	error of roughly 1e-2, well inside the margin of a 0.92 threshold.
+	'''
+
+	def __init__(
+		self,
+		dim: int,
+		capacity: int = 1024,
+		max_entries: int | None = None,
+		quantize: bool = False,
+	) -> None:
+		self.dim = dim
+		self.quantize = quantize
+		self._max_entries = max_entries
+		self._capacity = max(1, min(capacity, max_entries) if max_entries else capacity)
+		self._n = 0
+		self._oldest = 0
+		self._responses: list[str] = []
+		if np is not None:
+			self._mat = np.empty((self._capacity, dim), dtype=np.int8 if quantize else np.float32)
+			self._scales = np.empty(self._capacity, dtype=np.float32)
+		else:
+			self._mat = array('b' if quantize else 'f', bytes(self._row_bytes * self._capacity))
+			self._scales = array('f', bytes(4 * self._capacity))
+
+	@property
+	def _row_bytes(self) -> int:
+		return self.dim if self.quantize else 4 * self.dim
+
+	def __len__(self) -> int:
+		return self._n
+
+	def add(self, embedding: Any, response: str) -> None:
+		'''Store a unit-length embedding (from ``_normalize``) and its response.'''
+		if self._max_entries is not None and self._n >= self._max_entries:
+			row = self._oldest
+			self._oldest = (self._oldest + 1) % self._max_entries
+			self._responses[row] = response
+		else:
+			if self._n == self._capacity:
+				self._grow()
+			row = self._n
+			self._n += 1
+			self._responses.append(response)
+
+		if self.quantize:
+			embedding, self._scales[row] = _quantize(embedding)
+		if np is not None:
+			self._mat[row] = embedding
+		else:
+			self._mat[row * self.dim:(row + 1) * self.dim] = embedding
+
+	def query(self, embedding: Any) -> tuple[str, float] | None:
+		'''Best (response, cosine similarity) for a unit-length embedding; None when empty.'''
+		n = self._n
+		if n == 0:
+			return None
+		q_scale = 1.0
+		if self.quantize:
+			embedding, q_scale = _quantize(embedding)
+
+		if np is not None:
+			if self.quantize:
+				# No int8 BLAS path in numpy: accumulate in int32 (int16 would
+				# overflow at 127 * 127 * D), then rescale per row
+				raw = self._mat[:n].astype(np.int32) @ embedding.astype(np.int32)
+				scores = raw.astype(np.float32) * self._scales[:n] * q_scale
+			else:
+				scores = self._mat[:n] @ embedding
+			idx = int(scores.argmax())
+			return self._responses[idx], float(scores[idx])
+
+		dim = self.dim
+		rows = memoryview(self._mat)
+		best_idx, best_raw = 0, -math.inf
+		for i in range(n):
+			raw = sum(map(operator.mul, rows[i * dim:(i + 1) * dim], embedding))
+			if self.quantize:
+				raw *= self._scales[i]
+			if raw > best_raw:
+				best_idx, best_raw = i, raw
+		return self._responses[best_idx], best_raw * q_scale
+
+	def _grow(self) -> None:
+		capacity = self._capacity * 2
+		if self._max_entries is not None:
+			capacity = min(capacity, self._max_entries)
+		if np is not None:
+			mat = np.empty((capacity, self.dim), dtype=self._mat.dtype)
+			mat[:self._n] = self._mat[:self._n]
+			self._mat = mat
+			scales = np.empty(capacity, dtype=np.float32)
+			scales[:self._n] = self._scales[:self._n]
+			self._scales = scales
+		else:
+			extra = capacity - self._capacity
+			self._mat.frombytes(bytes(self._row_bytes * extra))
+			self._scales.frombytes(bytes(4 * extra))
+		self._capacity = capacity
+
+
+class SemanticLLMCache:
+	'''Nearest-neighbour response cache over prompt embeddings.
+
+	Args:
+		embed: Async callable mapping a prompt to its embedding vector, e.g.
+			``openai_embedder(client)`` or a wrapped local sentence-transformers model.
+		threshold: Minimum cosine similarity for a cached response to be reused.
+		max_entries: Per-namespace capacity; the oldest entries are overwritten first.
+		quantize: Store embeddings as int8 (see EmbeddingStore) to cut memory 4x.
+	'''
+
+	def __init__(
+		self,
+		embed: Embedder,
+		threshold: float = 0.92,
+		max_entries: int = 4096,
+		quantize: bool = False,
+	) -> None:
+		self._embed = embed
+		self.threshold = threshold
+		self._max_entries = max_entries
+		self._quantize = quantize
+		self._stores: dict[str, EmbeddingStore] = {}
+
+	async def lookup(self, namespace: str, prompt: str) -> tuple[str | None, Any]:
+		'''Return (cached response or None, normalized prompt embedding).
+
+		The embedding is returned so a subsequent ``add`` does not embed the
+		prompt again. Embedding failures are logged and treated as misses.
+		'''
+		try:
+			query = _normalize(await self._embed(prompt))
+		except Exception as exc:
+			logger.warning(f'Semantic cache embedding failed: {exc}')
+			return None, None
+		if query is None:
+			return None, None
+
+		store = self._stores.get(namespace)
+		if store is None:
+			return None, query
+		if store.dim != len(query):
+			logger.warning(f'Semantic cache embedding size changed ({store.dim} -> {len(query)})')
+			return None, None
+
+		best = store.query(query)
+		if best is not None and best[1] > self.threshold:
+			logger.debug(f'Semantic cache hit (similarity {best[1]:.3f})')
+			return best[0], query
+		return None, query
+
+	def add(self, namespace: str, embedding: Any, response: str) -> None:
+		'''Store a response under its normalized prompt embedding (from ``lookup``).'''
+		if embedding is None:
+			return
+		store = self._stores.get(namespace)
+		if store is None:
+			store = self._stores[namespace] = EmbeddingStore(
+				len(embedding),
+				capacity=min(1024, self._max_entries),
+				max_entries=self._max_entries,
+				quantize=self._quantize,
+			)
+		store.add(embedding, response)
+
+	def clear(self) -> None:
+		'''Drop every cached entry.'''
+		self._stores.clear()
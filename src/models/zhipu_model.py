@@ -1,8 +1,9 @@
 import asyncio
 from collections.abc import AsyncIterator
 from typing import Any, Dict
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from zai import ZhipuAiClient
+# zai.core does not re-export APIConnectionError (base of APITimeoutError)
+from zai.core._errors import APIConnectionError, APIStatusError
 from .base import LLMConfig, AsyncBaseLLM
 from .model_usage import ModelUsage
 
@@ -10,6 +11,9 @@ from .model_usage import ModelUsage
 class AsyncZhipuLLM(AsyncBaseLLM):
 	'''Async wrapper for Zhipu GLM API (zai-sdk).'''
 
+	# APIStatusError covers every HTTP error and is narrowed in _is_retryable.
+	_retry_exceptions = (APIConnectionError, APIStatusError)
+
 	def __init__(
 		self,
 		config: LLMConfig,
@@ -19,12 +23,11 @@ class AsyncZhipuLLM(AsyncBaseLLM):
 		super().__init__(config)
 		self._client = client or ZhipuAiClient(api_key=self.config.api_key or None)
 
-	@retry(reraise=True, stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), retry=retry_if_exception_type(Exception))
-	async def __call__(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
+	async def _do_call(self, prompt: str, **kwargs: Any) -> str | AsyncIterator[str]:
 		'''Call the Zhipu GLM LLM. Returns str or AsyncIterator[str] for streaming.'''
 		payload: Dict[str, Any] = {
 			'model': self.config.id,
-			'messages': [{'role': 'user', 'content': prompt}],
+			'messages': self._chat_messages(prompt),
 		}
 		if self.config.temperature is not None:
 			payload['temperature'] = self.config.temperature
@@ -60,6 +63,12 @@ class AsyncZhipuLLM(AsyncBaseLLM):
 		self._record_usage(response)
 		return self._extract_content(response)
 
+	def _is_retryable(self, exc: BaseException) -> bool:
+		'''Retry connection failures and 429/5xx responses, not other 4xx errors.'''
+		if isinstance(exc, APIStatusError):
+			return exc.status_code == 429 or exc.status_code >= 500
+		return True
+
 	def _record_usage(self, response: Any) -> None:
 		'''Extract usage from Zhipu response and record to ModelUsage.'''
 		usage = getattr(response, 'usage', None)
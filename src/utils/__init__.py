@@ -1,8 +1,9 @@
-from .logger import setup_logging, get_logger
+from .logger import setup_logging, ensure_default_logging, get_logger
 from .file_utils import download_file, load_json
 
 __all__ = [
     'setup_logging',
+    'ensure_default_logging',
     'get_logger',
     'download_file',
     'load_json',
@@ -1,16 +1,38 @@
 import os
 import json
+import mmap
+import shutil
 import requests
+from typing import Any
 from .logger import get_logger
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, fall back to stdlib json
+    orjson = None
+
 
 logger = get_logger(__name__)
 
+# Read/write granularity for streamed downloads
+_CHUNK_SIZE = 1 << 20
+
+# Files above this size are parsed straight from an mmap'd view
+_MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+def _loads(data: bytes | bytearray | memoryview) -> Any:
+    '''Parse a JSON document from bytes with orjson when available.'''
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-def download_file(url: str, destination_path: str, max_retries: int = 3, timeout: int = 10) -> None:
+
+def download_file(url: str, destination_path: str, max_retries: int = 3, timeout: int = 10, verbose: bool = True) -> None:
     '''
     Download a file from a URL to a local destination.
+    Shows a tqdm progress bar when verbose is True; otherwise streams straight to disk.
     '''
     
     # if destination directory does not exist, create it
@@ -25,20 +47,32 @@ def download_file(url: str, destination_path: str, max_retries: int = 3, timeout
                 resume_pos = os.path.getsize(destination_path)
                 logger.info(f'Resuming download from byte position {resume_pos}')
 
-            resp_head = requests.head(url, timeout=timeout)
-            total_size = int(resp_head.headers.get('Content-Length', 0))
+            # Only a resumed download needs the total size before issuing the GET
+            total_size = 0
+            if resume_pos > 0:
+                resp_head = requests.head(url, timeout=timeout)
+                total_size = int(resp_head.headers.get('Content-Length', 0))
 
             if total_size == 0 or resume_pos < total_size:
                 headers = {'Range': f'bytes={resume_pos}-'} if resume_pos > 0 else {}
                 with requests.get(url, headers=headers, stream=True, timeout=timeout) as r:
                     r.raise_for_status()
+                    if resume_pos > 0 and r.status_code != 206:
+                        # Server ignored the Range header, so restart from scratch
+                        resume_pos = 0
+                    if total_size == 0:
+                        total_size = resume_pos + int(r.headers.get('Content-Length', 0))
                     mode = 'ab' if resume_pos > 0 else 'wb'
                     
-                    with tqdm(total=total_size, initial=resume_pos, unit='iB', unit_scale=True, desc=os.path.basename(destination_path)) as pbar, open(destination_path, mode) as f:
-                        for chunk in r.iter_content(chunk_size=1024):
-                            if chunk:
-                                size = f.write(chunk)
-                                pbar.update(size)
+                    with open(destination_path, mode) as f:
+                        if verbose:
+                            with tqdm(total=total_size, initial=resume_pos, unit='iB', unit_scale=True, desc=os.path.basename(destination_path)) as pbar:
+                                for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
+                                    if chunk:
+                                        pbar.update(f.write(chunk))
+                        else:
+                            r.raw.decode_content = True
+                            shutil.copyfileobj(r.raw, f, length=_CHUNK_SIZE)
             
             logger.info(f'Successfully downloaded {url} to {destination_path}')
             return
@@ -64,16 +98,19 @@ def load_json(file_path: str) -> list[dict] | dict:
 
     if not os.path.exists(file_path):
         raise FileNotFoundError(f'File not found: {file_path}')
-    data = []
-    with open(file_path, 'r', encoding='utf-8') as f:
+    if not file_path.endswith(('.json', '.jsonl')):
+        raise ValueError(f'Unsupported file format: {file_path}')
+
+    # Read raw bytes: orjson parses UTF-8 directly and skips the decode step
+    with open(file_path, 'rb') as f:
         if file_path.endswith('.jsonl'):
-            for line in f:
-                data.append(json.loads(line))
-        elif file_path.endswith('.json'):
-            data = json.load(f)
-        else:
-            raise ValueError(f'Unsupported file format: {file_path}')
-    return data
+            return [_loads(line) for line in f if line.strip()]
+
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(f.read())
 
 
 # Example usage
@@ -1,13 +1,14 @@
 # A logger utility support standard output with color and file logging
 # 
 # Usage:
-#   1. Call setup_logging() once at application startup (e.g., in main.py)
+#   1. Call ensure_default_logging() (or setup_logging()) once at application
+#      startup (e.g., in main.py); importing this module configures nothing
 #   2. In each module, use: logger = logging.getLogger(__name__)
 #
 # Example:
 #   # main.py
-#   from utils.logger import setup_logging
-#   setup_logging()
+#   from utils.logger import ensure_default_logging
+#   ensure_default_logging()
 #
 #   # benchmarks/utils.py
 #   import logging
@@ -16,7 +17,9 @@
 
 import os
 import logging
+import logging.handlers
 from contextlib import contextmanager
+from contextvars import ContextVar
 from logging import Logger
 from ..config.paths import SEMAPaths
 
@@ -34,10 +37,62 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Resolve (color, reset) pairs once; unknown levels keep the old reset-wrapped output
+        self._wrap = {level: (color, self.RESET) for level, color in self.COLORS.items()}
+        self._default_wrap = (self.RESET, self.RESET)
+
     def format(self, record: logging.LogRecord) -> str:
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        message = super().format(record)
-        return f'{log_color}{message}{self.RESET}'
+        color, reset = self._wrap.get(record.levelname, self._default_wrap)
+        return color + super().format(record) + reset
+
+
+# Active suppress_logging() rules for the current thread / async task:
+# (logger name, minimum level) pairs; '' is the root logger and matches all.
+_suppress_rules: ContextVar[tuple[tuple[str, int], ...]] = ContextVar('_suppress_rules', default=())
+
+
+class _SuppressFilter(logging.Filter):
+    '''Handler filter applying the calling context's suppress_logging() rules.'''
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for name, level in _suppress_rules.get():
+            if record.levelno < level and (
+                not name or record.name == name or record.name.startswith(name + '.')
+            ):
+                return False
+        return True
+
+
+_suppress_filter = _SuppressFilter()
+
+
+def _install_suppress_filter(logger: Logger) -> None:
+    '''Attach the shared suppress filter to the handlers that will see logger's records.
+
+    That includes logging.lastResort, which receives records when no handler
+    is configured (the default, since importing this module sets none up).
+    '''
+    handlers = [logging.lastResort] if logging.lastResort is not None else []
+    current = logger
+    while current is not None:
+        handlers.extend(current.handlers)
+        current = current.parent if current.propagate else None
+    for handler in handlers:
+        if _suppress_filter not in handler.filters:
+            handler.addFilter(_suppress_filter)
+
+
+def _supports_color(stream) -> bool:
+    '''Whether ANSI colors should be written to stream (a TTY, honouring NO_COLOR and TERM=dumb).'''
+    isatty = getattr(stream, 'isatty', None)
+    return (
+        isatty is not None
+        and isatty()
+        and os.environ.get('NO_COLOR') is None
+        and os.environ.get('TERM') != 'dumb'
+    )
 
 
 def setup_logging(log_file: str = None, level: int = logging.DEBUG) -> None:
@@ -61,25 +116,42 @@ def setup_logging(log_file: str = None, level: int = logging.DEBUG) -> None:
     for noisy in ('httpx', 'httpcore', 'openai._base_client'):
         logging.getLogger(noisy).setLevel(logging.WARNING)
 
-    # Console handler with colored formatter
+    # Console handler; colors only when writing to a terminal so piped and
+    # CI logs stay free of escape codes
     console_handler = logging.StreamHandler()
-    console_formatter = ColoredFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    formatter_class = ColoredFormatter if _supports_color(console_handler.stream) else logging.Formatter
+    console_formatter = formatter_class('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
 
     # File handler with standard formatter
     if log_file:
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Rotate at 10 MB, keeping 3 backups, to bound disk usage
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=10_000_000, backupCount=3, encoding='utf-8'
+        )
         file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_formatter)
         root_logger.addHandler(file_handler)
 
+    _install_suppress_filter(root_logger)
+
+
+def ensure_default_logging(level: int = logging.DEBUG) -> None:
+    '''
+    Setup logging with the default log file from SEMAPaths.
+    Idempotent: does nothing if the root logger already has handlers.
+    '''
+    if logging.getLogger().handlers:
+        return
+    setup_logging(str(SEMAPaths.load().logs), level=level)
+
 
 def get_logger(name: str) -> Logger:
     '''
     Get a logger with the specified name.
-    Make sure setup_logging() is called before using this.
+    Make sure ensure_default_logging() or setup_logging() is called before using this.
     '''
     return logging.getLogger(name)
 
@@ -87,31 +159,29 @@ def get_logger(name: str) -> Logger:
 @contextmanager
 def suppress_logging(level: int = logging.ERROR, logger: Logger | None = None):
     '''
-    Temporarily raise the log threshold to the specified level within a context.
+    Temporarily suppress messages below the specified level within a context.
+
+    Scoped to the current thread / async task via a context variable, so
+    concurrent tasks keep logging normally; logger levels are not touched.
 
     Args:
         level: Temporary log level to apply. Messages below this level are suppressed.
-        logger: Target logger. Defaults to the root logger when not provided.
+        logger: Target logger (and its children). Defaults to the root logger when not provided.
     '''
     target_logger = logger or logging.getLogger()
-    original_level = target_logger.level
-    target_logger.setLevel(level)
+    _install_suppress_filter(target_logger)
+    name = '' if target_logger is logging.getLogger() else target_logger.name
+    token = _suppress_rules.set(_suppress_rules.get() + ((name, level),))
     try:
         yield
     finally:
-        target_logger.setLevel(original_level)
-
-
-# Default log path
-_default_log_path = str(SEMAPaths.load().logs)
-
-# For convenience, setup logging when this module is imported
-# You can also call setup_logging() explicitly in your main.py for more control
-setup_logging(_default_log_path)
+        _suppress_rules.reset(token)
 
 
 # Example usage:
 if __name__ == '__main__':
+    ensure_default_logging()
+
     # Backward compatible: export a default logger instance
     logger = get_logger('SEMA')
 
@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+from src.models.base import AsyncBaseLLM
+from src.models.model_usage import ModelUsage
+
+
+@pytest.fixture
+def model_usage(tmp_path):
+    '''Fresh ModelUsage singleton priced from an empty prices.json in tmp_path.'''
+    ModelUsage._instance = None
+    cache_file = tmp_path / "prices.json"
+    cache_file.write_text("{}", encoding="utf-8")
+    yield ModelUsage.get_instance(pricing_path=cache_file)
+    ModelUsage._instance = None
+
+
+@pytest.fixture
+def openai_response():
+    '''Factory for ChatCompletion-shaped mocks carrying the given content and no usage.'''
+
+    def _make(text):
+        mock_message = MagicMock()
+        mock_message.content = text
+        mock_choice = MagicMock()
+        mock_choice.message = mock_message
+        mock_response = MagicMock()
+        mock_response.choices = [mock_choice]
+        mock_response.usage = None
+        return mock_response
+
+    return _make
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    '''Serve the shared httpx pool from a handler: mock_http(lambda request: httpx.Response(...)).
+
+    Each pool remembers the event loop that built it and fails any request
+    sent from another loop, as real keep-alive connections would.
+    '''
+    monkeypatch.setattr(AsyncBaseLLM, "_shared_loop", None)
+    monkeypatch.setattr(AsyncBaseLLM, "_shared_clients", {})
+    pools = []
+
+    def install(handler):
+        def new_client():
+            loop = asyncio.get_running_loop()
+
+            def checked(request):
+                assert asyncio.get_running_loop() is loop, "pool reused across event loops"
+                return handler(request)
+
+            pools.append(httpx.AsyncClient(transport=httpx.MockTransport(checked)))
+            return pools[-1]
+
+        monkeypatch.setattr(AsyncBaseLLM, "_new_http_client", staticmethod(new_client))
+        return pools
+
+    return install
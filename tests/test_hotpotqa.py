@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from src.benchmarks.benchmark import Benchmark
+from src.benchmarks.hotpotqa import HotpotQA
+
+
+def _sample(i, question, answer):
+    return {"_id": f"q{i}", "question": question, "answer": answer, "context": [[f"title {i}", []]]}
+
+
+class TestHotpotQARun:
+    def _make_benchmark(self, tmp_path, monkeypatch, data):
+        monkeypatch.setattr(HotpotQA, "load_data", lambda self, force_reload=False: None)
+        benchmark = HotpotQA(data_folder=str(tmp_path))
+        benchmark._validate_data = data
+        return benchmark
+
+    @pytest.mark.asyncio
+    async def test_results_keep_dataset_order_under_bounded_concurrency(self, tmp_path, monkeypatch):
+        data = [_sample(i, f"question {i}", f"answer {i}") for i in range(8)]
+        benchmark = self._make_benchmark(tmp_path, monkeypatch, data)
+
+        in_flight = 0
+        peak = 0
+
+        async def callback(question, context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            i = int(question.split()[-1])
+            # Later samples finish first
+            await asyncio.sleep(0.002 * (8 - i))
+            in_flight -= 1
+            return f"answer {i}"
+
+        output = await benchmark.run(callback, concurrency=3)
+
+        assert [r["id"] for r in output["results"]] == [f"q{i}" for i in range(8)]
+        assert [r["prediction"] for r in output["results"]] == [f"answer {i}" for i in range(8)]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_error_rows_and_aggregate_metrics(self, tmp_path, monkeypatch):
+        data = [
+            _sample(0, "first", "Spy Kids"),
+            _sample(1, "second", "Paris France"),
+            _sample(2, "third", "42"),
+            _sample(3, "fourth", "blue"),
+        ]
+        benchmark = self._make_benchmark(tmp_path, monkeypatch, data)
+        answers = {"first": "spy kids", "second": "Paris", "fourth": "red"}
+
+        async def callback(question, context):
+            if question == "third":
+                raise RuntimeError("model unavailable")
+            return answers[question]
+
+        output = await benchmark.run(callback, num_samples=4)
+        results = output["results"]
+
+        assert [r["result"] for r in results] == [Benchmark.PASS, Benchmark.FAIL, Benchmark.FAIL, Benchmark.FAIL]
+        assert results[1]["f1"] == pytest.approx(2 / 3)
+        assert results[2] == {
+            "id": "q2", "question": "third", "prediction": "", "ground_truth": "42",
+            "em": 0.0, "f1": 0.0, "result": Benchmark.FAIL, "error": "model unavailable",
+        }
+        assert "error" not in results[0]
+        assert output["metrics"] == {
+            "exact_match": pytest.approx(0.25),
+            "f1": pytest.approx((1 + 2 / 3) / 4),
+            "num_samples": 4,
+            "num_passed": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_unloaded_dataset_is_rejected(self, tmp_path, monkeypatch):
+        benchmark = self._make_benchmark(tmp_path, monkeypatch, None)
+
+        with pytest.raises(ValueError):
+            await benchmark.run(lambda q, c: None)
@@ -0,0 +1,78 @@
+import pytest
+from src.models.base import is_local_url
+
+
+class TestIsLocalUrl:
+    @pytest.mark.parametrize("url", [
+        "http://localhost:11434",
+        "http://127.0.0.1:8080/v1",
+        "http://[::1]:8080/v1",
+        "localhost:11434",
+        "127.0.0.1:8080",
+        "localhost",
+    ])
+    def test_local(self, url):
+        assert is_local_url(url)
+
+    @pytest.mark.parametrize("url", [
+        "https://api.openai.com/v1",
+        "ollama.internal:11434",
+        "http://localhost.example.com",
+        "",
+    ])
+    def test_remote(self, url):
+        assert not is_local_url(url)
+
+
+class TestRegisterProvider:
+    def _config_path(self, tmp_path):
+        path = tmp_path / "llm_config.json"
+        path.write_text('{"custom-model": {"provider": "custom"}}', encoding="utf-8")
+        return path
+
+    @pytest.mark.asyncio
+    async def test_subclass_overriding_only_call(self, tmp_path, monkeypatch):
+        from src.models.base import AsyncBaseLLM
+        from src.models.models import AsyncLLM
+
+        class EchoLLM(AsyncBaseLLM):
+            async def __call__(self, prompt, **kwargs):
+                return prompt.upper()
+
+            def _record_usage(self, response):
+                pass
+
+            @staticmethod
+            def _extract_content(response):
+                return str(response)
+
+        monkeypatch.setitem(AsyncLLM._provider_registry, "custom", None)
+        AsyncLLM.register_provider("Custom", EchoLLM)
+        llm = AsyncLLM("custom-model", config_path=self._config_path(tmp_path))
+
+        assert isinstance(llm, EchoLLM)
+        assert await llm("hi") == "HI"
+        with pytest.raises(NotImplementedError, match="EchoLLM must implement _do_call"):
+            await llm.stream("hi").__anext__()
+
+    @pytest.mark.asyncio
+    async def test_subclass_implementing_do_call(self, tmp_path, monkeypatch):
+        from src.models.base import AsyncBaseLLM
+        from src.models.models import AsyncLLM
+
+        class EchoLLM(AsyncBaseLLM):
+            async def _do_call(self, prompt, **kwargs):
+                return prompt.upper()
+
+            def _record_usage(self, response):
+                pass
+
+            @staticmethod
+            def _extract_content(response):
+                return str(response)
+
+        monkeypatch.setitem(AsyncLLM._provider_registry, "custom", None)
+        AsyncLLM.register_provider("custom", EchoLLM)
+        llm = AsyncLLM("custom-model", config_path=self._config_path(tmp_path))
+
+        assert await llm.batch_call(["a", "b"]) == ["A", "B"]
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+
+class TestBatchCall:
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_bounds_concurrency(self, model_usage, openai_response):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        in_flight = 0
+        peak = 0
+
+        async def create(**payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            prompt = payload["messages"][-1]["content"]
+            # Later prompts finish first, so ordering must come from gather
+            await asyncio.sleep(0.01 / int(prompt))
+            in_flight -= 1
+            return openai_response(f"answer {prompt}")
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="", api_key="fake", temperature=0.7,
+        )
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=create)
+        llm = AsyncOpenAILLM(config, client=mock_client)
+
+        prompts = [str(i) for i in range(1, 9)]
+        results = await llm.batch_call(prompts, max_concurrency=3)
+
+        assert results == [f"answer {p}" for p in prompts]
+        assert mock_client.chat.completions.create.await_count == 8
+        assert peak == 3
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_dispatched_together(self, model_usage, openai_response):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        dispatch_ticks = []
+
+        async def create(**payload):
+            dispatch_ticks.append(asyncio.get_running_loop().time())
+            prompt = payload["messages"][-1]["content"]
+            if prompt == "bad":
+                raise ValueError("no content")
+            return openai_response(f"answer {prompt}")
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="", api_key="fake", temperature=0.7,
+        )
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=create)
+        llm = AsyncOpenAILLM(config, client=mock_client, coalesce=True, batch_window_ms=20, max_batch=2)
+
+        results = await asyncio.gather(
+            llm("a"), llm("b"), llm("bad"), return_exceptions=True
+        )
+
+        assert results[:2] == ["answer a", "answer b"]
+        assert isinstance(results[2], ValueError)
+        # max_batch=2 flushes the first pair at once; the third waits for the window
+        assert dispatch_ticks[1] - dispatch_ticks[0] < 0.01
+        assert dispatch_ticks[2] - dispatch_ticks[0] >= 0.015
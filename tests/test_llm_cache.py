@@ -0,0 +1,162 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.models.cache import LLMCache, MemoryBackend
+from src.models.semantic_cache import EmbeddingStore, SemanticLLMCache, _normalize
+
+
+class TestLLMCache:
+    @pytest.mark.asyncio
+    async def test_set_then_get_roundtrip(self, tmp_path):
+        cache = LLMCache(db_path=tmp_path / "cache.db")
+        key = LLMCache.make_key("m", "prompt", 0.0)
+
+        assert await cache.get(key) is None
+        await cache.set(key, "answer")
+        assert await cache.get(key) == "answer"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = LLMCache(db_path=tmp_path / "cache.db", ttl_s=-1)
+        key = LLMCache.make_key("m", "prompt", 0.0)
+        await cache.set(key, "answer")
+        assert await cache.get(key) is None
+
+    def test_key_depends_on_model_prompt_and_overrides(self):
+        base = LLMCache.make_key("m", "p", 0.0)
+        assert base == LLMCache.make_key("m", "p", 0.0)
+        assert base != LLMCache.make_key("other", "p", 0.0)
+        assert base != LLMCache.make_key("m", "q", 0.0)
+        assert base != LLMCache.make_key("m", "p", 0.0, {"payload_override": {"max_tokens": 5}})
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_evicts_least_recently_used(self):
+        cache = LLMCache(backend=MemoryBackend(maxsize=2))
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        assert await cache.get("a") == "1"
+        await cache.set("c", "3")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "1"
+        assert await cache.get("c") == "3"
+        assert cache.stats() == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_expired_entry_is_a_miss(self):
+        cache = LLMCache(backend=MemoryBackend(ttl_s=-1))
+        await cache.set("a", "1")
+        assert await cache.get("a") is None
+
+
+@pytest.mark.usefixtures("model_usage")
+class TestProviderCaching:
+    def setup_method(self):
+        LLMCache._instance = None
+
+    def _make_llm(self, tmp_path, monkeypatch, openai_response, temperature):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        monkeypatch.setenv("SEMA_LLM_CACHE", "1")
+        LLMCache._instance = LLMCache(db_path=tmp_path / "cache.db")
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="", api_key="fake", temperature=temperature,
+        )
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=openai_response("cached answer"))
+        return AsyncOpenAILLM(config, client=mock_client), mock_client
+
+    @pytest.mark.asyncio
+    async def test_deterministic_call_hits_cache(self, tmp_path, monkeypatch, openai_response):
+        llm, mock_client = self._make_llm(tmp_path, monkeypatch, openai_response, temperature=0.0)
+
+        assert await llm("same prompt") == "cached answer"
+        assert await llm("same prompt") == "cached answer"
+        assert mock_client.chat.completions.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sampled_call_bypasses_cache(self, tmp_path, monkeypatch, openai_response):
+        llm, mock_client = self._make_llm(tmp_path, monkeypatch, openai_response, temperature=0.7)
+
+        await llm("same prompt")
+        await llm("same prompt")
+        assert mock_client.chat.completions.create.await_count == 2
+
+
+class TestEmbeddingStore:
+    def test_grows_and_returns_best_match(self):
+        store = EmbeddingStore(dim=2, capacity=1)
+        store.add(_normalize([1.0, 0.0]), "x")
+        store.add(_normalize([0.0, 1.0]), "y")
+        store.add(_normalize([1.0, 1.0]), "xy")
+
+        assert len(store) == 3
+        response, score = store.query(_normalize([0.1, 1.0]))
+        assert response == "y"
+        assert score == pytest.approx(0.995, abs=1e-3)
+
+    def test_overwrites_oldest_when_full(self):
+        store = EmbeddingStore(dim=2, max_entries=2)
+        store.add(_normalize([1.0, 0.0]), "old")
+        store.add(_normalize([0.0, 1.0]), "y")
+        store.add(_normalize([1.0, 0.1]), "new")
+
+        assert len(store) == 2
+        assert store.query(_normalize([1.0, 0.0]))[0] == "new"
+
+    def test_quantized_scores_match_float(self):
+        vectors = [[1.0, 0.2, -0.3], [0.1, 1.0, 0.4], [-0.5, 0.3, 1.0]]
+        exact = EmbeddingStore(dim=3)
+        quantized = EmbeddingStore(dim=3, quantize=True)
+        for i, v in enumerate(vectors):
+            exact.add(_normalize(v), str(i))
+            quantized.add(_normalize(v), str(i))
+
+        query = _normalize([0.2, 0.9, 0.5])
+        expected = exact.query(query)
+        response, score = quantized.query(query)
+        assert response == expected[0]
+        assert score == pytest.approx(expected[1], abs=1e-2)
+
+
+@pytest.mark.usefixtures("model_usage")
+class TestSemanticCache:
+    @staticmethod
+    async def _embed(text):
+        # Toy embedding: near-duplicates share a direction, everything else is orthogonal
+        return [1.0, 0.1] if "france" in text.lower() else [0.0, 1.0]
+
+    def _make_llm(self, openai_response, temperature):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="", api_key="fake", temperature=temperature, semantic_cache=True,
+        )
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=openai_response("Paris"))
+        llm = AsyncOpenAILLM(config, client=mock_client)
+        llm.semantic_cache = SemanticLLMCache(self._embed)
+        return llm, mock_client
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_prompt_hits(self, openai_response):
+        llm, mock_client = self._make_llm(openai_response, temperature=0.0)
+
+        assert await llm("Capital of France?") == "Paris"
+        assert await llm("France's capital?") == "Paris"
+        assert mock_client.chat.completions.create.await_count == 1
+
+        await llm("Capital of Spain?")
+        assert mock_client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sampled_call_bypasses_semantic_cache(self, openai_response):
+        llm, mock_client = self._make_llm(openai_response, temperature=0.7)
+
+        await llm("Capital of France?")
+        await llm("France's capital?")
+        assert mock_client.chat.completions.create.await_count == 2
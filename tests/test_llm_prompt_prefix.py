@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+class TestPromptPrefix:
+    @pytest.mark.asyncio
+    async def test_static_content_is_sent_first(self, model_usage, openai_response):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="", api_key="fake", temperature=0.7,
+            system_prompt="You are terse.", static_prefix="Long shared instructions.",
+        )
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=openai_response("ok"))
+        llm = AsyncOpenAILLM(config, client=mock_client)
+
+        await llm("Question?")
+
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        assert messages == [
+            {"role": "system", "content": "You are terse."},
+            {"role": "user", "content": "Long shared instructions."},
+            {"role": "user", "content": "Question?"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_anthropic_marks_static_blocks_for_caching(self, model_usage):
+        from src.models.claude_model import AsyncAnthropicLLM
+        from src.models.base import LLMConfig
+
+        config = LLMConfig(
+            id="claude-test", provider="anthropic", description="",
+            base_url="", api_key="fake", temperature=0.7,
+            system_prompt="You are terse.", static_prefix="Long shared instructions.",
+        )
+        response = MagicMock()
+        response.content = [MagicMock(type="text", text="ok")]
+        response.usage = None
+        mock_client = AsyncMock()
+        mock_client.messages.create = AsyncMock(return_value=response)
+        llm = AsyncAnthropicLLM(config, client=mock_client)
+
+        await llm("Question?")
+
+        payload = mock_client.messages.create.call_args.kwargs
+        ephemeral = {"type": "ephemeral"}
+        assert payload["system"] == [{"type": "text", "text": "You are terse.", "cache_control": ephemeral}]
+        assert payload["messages"] == [{"role": "user", "content": [
+            {"type": "text", "text": "Long shared instructions.", "cache_control": ephemeral},
+            {"type": "text", "text": "Question?"},
+        ]}]
+
+    def test_prefixes_are_part_of_the_cache_key(self, monkeypatch):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        monkeypatch.setenv("SEMA_LLM_CACHE", "1")
+
+        def make(system_prompt):
+            config = LLMConfig(
+                id="gpt-4o-mini", provider="openai", description="",
+                base_url="", api_key="fake", temperature=0.0, system_prompt=system_prompt,
+            )
+            return AsyncOpenAILLM(config, client=AsyncMock())
+
+        assert make("a")._cache_key("p", {}) != make("b")._cache_key("p", {})
+        assert make(None)._cache_key("p", {}) != make("a")._cache_key("p", {})
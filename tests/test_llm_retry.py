@@ -0,0 +1,158 @@
+import httpx
+import openai
+import pytest
+from google.genai import errors as genai_errors
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _request():
+    return httpx.Request("POST", "https://api.example.com/v1/chat/completions")
+
+
+def _connection_error():
+    return openai.APIConnectionError(request=_request())
+
+
+def _status_error(cls, status, headers=None):
+    response = httpx.Response(status, headers=headers or {}, request=_request())
+    return cls("error", response=response, body=None)
+
+
+def _anthropic_status_error(status):
+    import anthropic
+    from anthropic._exceptions import OverloadedError
+
+    cls = {400: anthropic.BadRequestError, 529: OverloadedError}.get(status, anthropic.APIStatusError)
+    return cls("error", response=httpx.Response(status, request=_request()), body=None)
+
+
+def _zhipu_status_error(status):
+    from zai.core._errors import APIStatusError
+
+    return APIStatusError("error", response=httpx.Response(status, request=_request()))
+
+
+@pytest.mark.usefixtures("model_usage")
+class TestRetry:
+    def _make_llm(self, monkeypatch, side_effect):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("src.models.base.asyncio.sleep", fake_sleep)
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="", api_key="fake", temperature=0.7,
+        )
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=side_effect)
+        return AsyncOpenAILLM(config, client=mock_client), mock_client, sleeps
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self, monkeypatch, openai_response):
+        llm, mock_client, sleeps = self._make_llm(
+            monkeypatch, [_connection_error(), openai_response("ok")]
+        )
+
+        assert await llm("prompt") == "ok"
+        assert mock_client.chat.completions.create.await_count == 2
+        assert len(sleeps) == 1 and 1 <= sleeps[0] <= 1.3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, monkeypatch):
+        llm, mock_client, sleeps = self._make_llm(
+            monkeypatch, _status_error(openai.InternalServerError, 500)
+        )
+
+        with pytest.raises(openai.InternalServerError):
+            await llm("prompt")
+        assert mock_client.chat.completions.create.await_count == 3
+        assert len(sleeps) == 2
+        assert 1 <= sleeps[0] <= 1.3 and 2 <= sleeps[1] <= 2.3
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_honours_retry_after(self, monkeypatch, openai_response):
+        error = _status_error(openai.RateLimitError, 429, {"retry-after": "3"})
+        llm, mock_client, sleeps = self._make_llm(
+            monkeypatch, [error, openai_response("ok")]
+        )
+
+        assert await llm("prompt") == "ok"
+        assert sleeps == [3.0]
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, monkeypatch):
+        llm, mock_client, sleeps = self._make_llm(
+            monkeypatch, _status_error(openai.BadRequestError, 400)
+        )
+
+        with pytest.raises(openai.BadRequestError):
+            await llm("prompt")
+        assert mock_client.chat.completions.create.await_count == 1
+        assert sleeps == []
+
+
+class TestProviderRetryPolicy:
+    @pytest.mark.asyncio
+    async def test_mlx_missing_content_is_not_retried(self, model_usage, monkeypatch):
+        from src.models.mlx_model import AsyncMLXLLM
+        from src.models.base import LLMConfig
+
+        async def fake_sleep(delay):
+            raise AssertionError("call was retried")
+
+        monkeypatch.setattr("src.models.base.asyncio.sleep", fake_sleep)
+
+        config = LLMConfig(
+            id="mlx-community/Qwen2.5-7B-Instruct-4bit", provider="mlx", description="",
+            base_url="http://localhost:8080/v1", api_key="", temperature=0.7,
+        )
+        empty = MagicMock()
+        empty.choices = []
+        empty.usage = None
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=empty)
+        llm = AsyncMLXLLM(config, client=mock_client)
+
+        with pytest.raises(ValueError):
+            await llm("prompt")
+        assert mock_client.chat.completions.create.await_count == 1
+
+    @pytest.mark.parametrize("provider, make_error, retried", [
+        ("mlx", lambda: _status_error(openai.BadRequestError, 400), False),
+        ("mlx", _connection_error, True),
+        ("gemini", lambda: genai_errors.ClientError(400, {}), False),
+        ("gemini", lambda: genai_errors.ClientError(429, {}), True),
+        ("gemini", lambda: genai_errors.ServerError(503, {}), True),
+        ("zhipu", lambda: _zhipu_status_error(400), False),
+        ("zhipu", lambda: _zhipu_status_error(429), True),
+        ("zhipu", lambda: _zhipu_status_error(500), True),
+        ("anthropic", lambda: _anthropic_status_error(400), False),
+        ("anthropic", lambda: _anthropic_status_error(529), True),
+        ("ollama", lambda: httpx.ReadError("connection reset"), True),
+        ("ollama", lambda: httpx.RemoteProtocolError("server disconnected"), True),
+        ("ollama", lambda: httpx.ReadTimeout("timed out"), True),
+    ])
+    def test_transient_errors_only(self, provider, make_error, retried):
+        from src.models.gemini_model import AsyncGeminiLLM
+        from src.models.mlx_model import AsyncMLXLLM
+        from src.models.zhipu_model import AsyncZhipuLLM
+        from src.models.claude_model import AsyncAnthropicLLM
+        from src.models.ollama_model import AsyncOllamaLLM
+        from src.models.base import LLMConfig
+
+        cls = {
+            "mlx": AsyncMLXLLM, "gemini": AsyncGeminiLLM, "zhipu": AsyncZhipuLLM,
+            "anthropic": AsyncAnthropicLLM, "ollama": AsyncOllamaLLM,
+        }[provider]
+        config = LLMConfig(id="m", provider=provider, description="", base_url="", api_key="fake")
+        llm = cls(config, client=MagicMock())
+        error = make_error()
+
+        assert (isinstance(error, cls._retry_exceptions) and llm._is_retryable(error)) is retried
+        assert not isinstance(ValueError("missing content"), cls._retry_exceptions)
@@ -96,6 +96,323 @@ class TestOpenAIUsage:
         assert usage.total_prompt_tokens == 10
         assert usage.total_completion_tokens == 5
 
+    @pytest.mark.asyncio
+    async def test_stream_method_yields_deltas(self, model_usage):
+        from src.models.openai_model import AsyncOpenAILLM
+        from src.models.base import LLMConfig
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="", api_key="fake", temperature=0.7,
+        )
+
+        chunk = MagicMock()
+        chunk.usage = None
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = "Hi"
+
+        async def mock_stream():
+            yield chunk
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_stream())
+
+        llm = AsyncOpenAILLM(config, client=mock_client)
+        chunks = [text async for text in llm.stream("test", payload_override={"max_tokens": 5})]
+
+        assert chunks == ["Hi"]
+        payload = mock_client.chat.completions.create.call_args.kwargs
+        assert payload["stream"] is True
+        assert payload["max_tokens"] == 5
+
+
+class TestOpenAIMsgspecDecode:
+    def _make_llm(self, mock_http, body):
+        import httpx
+        from src.models.base import LLMConfig
+        from src.models.openai_model import AsyncOpenAILLM
+
+        mock_http(lambda request: httpx.Response(200, json=body))
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="https://api.example.com/v1", api_key="fake", temperature=0.7,
+        )
+        llm = AsyncOpenAILLM(config)
+        assert llm._decode_raw
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_null_usage_counts_and_content_parts(self, mock_http, model_usage):
+        pytest.importorskip("msgspec")
+        body = {
+            "choices": [{"message": {"content": [{"type": "text", "text": "hi"}]}}],
+            "usage": {"prompt_tokens": 3, "completion_tokens": None},
+        }
+        llm = self._make_llm(mock_http, body)
+
+        assert await llm("test") == str([{"type": "text", "text": "hi"}])
+        assert model_usage.total_prompt_tokens == 3
+        assert model_usage.total_completion_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sdk_parse(self, mock_http, model_usage):
+        pytest.importorskip("msgspec")
+        body = {
+            "id": "x", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "hi"}}],
+            "usage": "unavailable",
+        }
+        llm = self._make_llm(mock_http, body)
+
+        assert await llm("test") == "hi"
+        assert model_usage.total_prompt_tokens == 0
+
+
+@pytest.mark.usefixtures("model_usage")
+class TestSharedHttpClientClose:
+    async def _call_across_close(self, monkeypatch, mock_http, llm_factory, body):
+        import httpx
+        from src.models.base import AsyncBaseLLM
+
+        async def fail_sleep(delay):
+            raise AssertionError("call was retried")
+
+        monkeypatch.setattr("src.models.base.asyncio.sleep", fail_sleep)
+        pools = mock_http(lambda request: httpx.Response(200, json=body))
+
+        llm = llm_factory()
+        first = await llm("test")
+        await AsyncBaseLLM.aclose_shared_http_client()
+        second = await llm("test")
+
+        assert len(pools) == 2 and pools[0].is_closed
+        return first, second
+
+    @pytest.mark.asyncio
+    async def test_openai_wrapper_survives_close(self, monkeypatch, mock_http):
+        from src.models.base import LLMConfig
+        from src.models.openai_model import AsyncOpenAILLM
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="https://api.example.com/v1", api_key="fake", temperature=0.7,
+        )
+        body = {
+            "id": "x", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "hi"}}],
+        }
+        first, second = await self._call_across_close(
+            monkeypatch, mock_http, lambda: AsyncOpenAILLM(config), body
+        )
+        assert first == second == "hi"
+
+    @pytest.mark.asyncio
+    async def test_anthropic_wrapper_survives_close(self, monkeypatch, mock_http):
+        from src.models.base import LLMConfig
+        from src.models.claude_model import AsyncAnthropicLLM
+
+        config = LLMConfig(
+            id="claude-test", provider="anthropic", description="",
+            base_url="https://api.example.com", api_key="fake", temperature=0.7,
+        )
+        body = {
+            "id": "m", "type": "message", "role": "assistant", "model": "claude-test",
+            "content": [{"type": "text", "text": "hi"}], "stop_reason": "end_turn",
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        }
+        first, second = await self._call_across_close(
+            monkeypatch, mock_http, lambda: AsyncAnthropicLLM(config), body
+        )
+        assert first == second == "hi"
+
+
+@pytest.mark.usefixtures("model_usage")
+class TestSharedClientsAcrossLoops:
+    '''Each asyncio.run gets its own pool; mock_http fails requests on another loop's pool.'''
+
+    def _run_twice(self, mock_http, llm_factory, body):
+        import asyncio
+        import httpx
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=body)
+
+        pools = mock_http(handler)
+        llm = llm_factory()
+        results = [asyncio.run(llm("a")), asyncio.run(llm("b")), asyncio.run(llm_factory()("c"))]
+
+        assert len(requests) == 3
+        assert len(pools) == 3
+        return results
+
+    def test_openai_wrapper_across_asyncio_runs(self, mock_http):
+        from src.models.base import LLMConfig
+        from src.models.openai_model import AsyncOpenAILLM
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="https://api.example.com/v1", api_key="fake", temperature=0.7,
+        )
+        body = {
+            "id": "x", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "hi"}}],
+        }
+        assert self._run_twice(mock_http, lambda: AsyncOpenAILLM(config), body) == ["hi"] * 3
+
+    def test_anthropic_wrapper_across_asyncio_runs(self, mock_http):
+        from src.models.base import LLMConfig
+        from src.models.claude_model import AsyncAnthropicLLM
+
+        config = LLMConfig(
+            id="claude-test", provider="anthropic", description="",
+            base_url="https://api.example.com", api_key="fake", temperature=0.7,
+        )
+        body = {
+            "id": "m", "type": "message", "role": "assistant", "model": "claude-test",
+            "content": [{"type": "text", "text": "hi"}], "stop_reason": "end_turn",
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        }
+        assert self._run_twice(mock_http, lambda: AsyncAnthropicLLM(config), body) == ["hi"] * 3
+
+    def test_ollama_wrapper_across_asyncio_runs(self, monkeypatch, mock_http):
+        import asyncio
+        import httpx
+        from ollama import AsyncClient
+        from src.models.base import AsyncBaseLLM, LLMConfig
+        from src.models.ollama_model import AsyncOllamaLLM
+
+        body = {
+            "model": "qwen2.5:7b", "done": True, "prompt_eval_count": 1, "eval_count": 1,
+            "message": {"role": "assistant", "content": "hi"},
+        }
+        clients = []
+
+        def new_client(host, trust_env):
+            loop = asyncio.get_running_loop()
+
+            def handler(request):
+                assert asyncio.get_running_loop() is loop, "client reused across event loops"
+                return httpx.Response(200, json=body)
+
+            clients.append(AsyncClient(host=host, trust_env=trust_env, transport=httpx.MockTransport(handler)))
+            return clients[-1]
+
+        monkeypatch.setattr("src.models.ollama_model.AsyncOllama", new_client)
+        config = LLMConfig(
+            id="qwen2.5:7b", provider="ollama", description="",
+            base_url="http://localhost:11434", api_key="", temperature=0.7,
+        )
+        llm = AsyncOllamaLLM(config)
+
+        async def call_then_close(prompt):
+            result = await llm(prompt)
+            await AsyncBaseLLM.aclose_shared_http_client()
+            return result
+
+        assert asyncio.run(llm("a")) == "hi"
+        assert asyncio.run(call_then_close("b")) == "hi"
+        assert len(clients) == 2
+        assert not clients[0]._client.is_closed
+        assert clients[1]._client.is_closed
+
+
+class TestOpenAIRawClient:
+    def _make_llm(self, monkeypatch, mock_http, responses):
+        from src.models.base import LLMConfig
+        from src.models.openai_model import AsyncOpenAILLM
+
+        async def fake_sleep(delay):
+            pass
+
+        monkeypatch.setattr("src.models.base.asyncio.sleep", fake_sleep)
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return responses.pop(0)
+
+        mock_http(handler)
+
+        config = LLMConfig(
+            id="gpt-4o-mini", provider="openai", description="",
+            base_url="https://api.example.com/v1", api_key="fake", temperature=0.7,
+            raw_client=True,
+        )
+        return AsyncOpenAILLM(config), requests
+
+    @pytest.mark.asyncio
+    async def test_posts_directly_and_records_usage(self, monkeypatch, mock_http, model_usage):
+        import httpx
+
+        body = {
+            "choices": [{"message": {"role": "assistant", "content": "Hello"}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+        }
+        llm, requests = self._make_llm(
+            monkeypatch, mock_http,
+            [httpx.Response(503), httpx.Response(200, json=body)],
+        )
+
+        assert await llm("test") == "Hello"
+        assert len(requests) == 2
+        assert str(requests[-1].url) == "https://api.example.com/v1/chat/completions"
+        assert requests[-1].headers["authorization"] == "Bearer fake"
+        assert model_usage.total_prompt_tokens == 7
+        assert model_usage.total_completion_tokens == 3
+
+    @pytest.mark.asyncio
+    async def test_null_usage_counts(self, monkeypatch, mock_http, model_usage):
+        import httpx
+
+        body = {
+            "choices": [{"message": {"content": "Hello"}}],
+            "usage": {"prompt_tokens": 4, "completion_tokens": None},
+        }
+        llm, _ = self._make_llm(monkeypatch, mock_http, [httpx.Response(200, json=body)])
+
+        assert await llm("test") == "Hello"
+        assert model_usage.total_prompt_tokens == 4
+        assert model_usage.total_completion_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_json_for_unexpected_shapes(self, monkeypatch, mock_http, model_usage):
+        import httpx
+
+        body = {"choices": [{"message": {"content": "Hello"}}], "usage": "unavailable"}
+        llm, _ = self._make_llm(monkeypatch, mock_http, [httpx.Response(200, json=body)])
+
+        assert await llm("test") == "Hello"
+        assert model_usage.total_prompt_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, monkeypatch, mock_http, model_usage):
+        import httpx
+
+        llm, requests = self._make_llm(monkeypatch, mock_http, [httpx.Response(400)])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await llm("test")
+        assert len(requests) == 1
+
+    def test_across_asyncio_runs(self, monkeypatch, mock_http, model_usage):
+        import asyncio
+        import httpx
+
+        body = {"choices": [{"message": {"content": "Hello"}}]}
+        llm, requests = self._make_llm(
+            monkeypatch, mock_http,
+            [httpx.Response(200, json=body), httpx.Response(200, json=body)],
+        )
+
+        assert asyncio.run(llm("a")) == "Hello"
+        assert asyncio.run(llm("b")) == "Hello"
+        assert len(requests) == 2
+
 
 class TestAnthropicUsage:
     def setup_method(self):
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+
+import pytest
+from src.utils.logger import suppress_logging
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestSuppressLogging:
+    def _isolated_logger(self, name, monkeypatch):
+        logger = logging.getLogger(name)
+        monkeypatch.setattr(logger, "propagate", False)
+        logger.setLevel(logging.DEBUG)
+        return logger
+
+    def test_suppresses_last_resort_output(self, monkeypatch, capsys):
+        # No handlers anywhere on the chain, so records go to logging.lastResort
+        logger = self._isolated_logger("sema.tests.no_handlers", monkeypatch)
+
+        with suppress_logging(logging.ERROR):
+            logger.warning("hidden")
+        logger.warning("shown")
+
+        err = capsys.readouterr().err
+        assert "hidden" not in err
+        assert "shown" in err
+
+    @pytest.mark.asyncio
+    async def test_scoped_to_the_calling_task(self, monkeypatch):
+        logger = self._isolated_logger("sema.tests.concurrent", monkeypatch)
+        handler = _ListHandler()
+        logger.addHandler(handler)
+        try:
+            entered = asyncio.Event()
+            logged = asyncio.Event()
+
+            async def quiet():
+                with suppress_logging(logging.ERROR, logger=logger):
+                    entered.set()
+                    await logged.wait()
+                    logger.warning("quiet warning")
+                    logger.error("quiet error")
+
+            async def loud():
+                await entered.wait()
+                logger.warning("loud warning")
+                logged.set()
+
+            await asyncio.gather(quiet(), loud())
+        finally:
+            logger.removeHandler(handler)
+
+        assert handler.messages == ["loud warning", "quiet error"]